@@ -1,95 +1,159 @@
 #!/usr/bin/env python3
+import hashlib
+import math
 import socket
+import sys
 import threading
 import time
-from datetime import datetime
-import os
+from collections import Counter, deque
 import json
 
+# Honeypot services and their ports
+SERVICES = [
+    ("SSH", 8022),
+    ("HTTP", 8080),
+    ("FTP", 8021),
+    ("Telnet", 8023)
+]
+
+# Connection open/close events kept for the display; older ones are dropped
+RECENT_CONNECTIONS = 256
+
+# ANSI clear screen and scrollback, then cursor home
+CLEAR_SCREEN = '\x1b[2J\x1b[3J\x1b[H'
+
+HEADER = """╔══════════════════════════════════════╗
+║         ACTIVE HONEYPOT MONITOR     ║
+║            Termux Edition           ║
+╚══════════════════════════════════════╝
+
+🎣 Honeypot services running on:
+   • SSH: 8022 | HTTP: 8080 | FTP: 8021 | Telnet: 8023
+
+📊 Statistics:
+"""
+
+# Pending-connection queue length for each listener
+LISTEN_BACKLOG = 1024
+
+# Canned service responses, encoded once
+SSH_BANNER = b"SSH-2.0-OpenSSH_8.2p1\r\n"
+FTP_BANNER = b"220 FTP Server Ready\r\n"
+TELNET_BANNER = b"Welcome\r\nlogin: "
+HTTP_BODY = b"<html><body><h1>Welcome</h1></body></html>"
+HTTP_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: close\r\n"
+    b"\r\n" % len(HTTP_BODY)
+) + HTTP_BODY
+
+class UniqueCounter:
+    """Approximate distinct-value counter (HyperLogLog) in fixed memory
+
+    2**14 one-byte registers give about 0.8% standard error regardless of
+    how many distinct values are added.
+    """
+    P = 14
+    M = 1 << P
+    ALPHA = 0.7213 / (1 + 1.079 / M)
+
+    def __init__(self):
+        self.registers = bytearray(self.M)
+        self._zeros = self.M
+        self._inv_sum = float(self.M)  # sum of 2**-register
+
+    def add(self, value):
+        h = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'big')
+        i = h & (self.M - 1)
+        w = h >> self.P
+        rank = (64 - self.P) - w.bit_length() + 1
+        old = self.registers[i]
+        if rank > old:
+            self.registers[i] = rank
+            self._inv_sum += 2.0 ** -rank - 2.0 ** -old
+            if old == 0:
+                self._zeros -= 1
+
+    def __len__(self):
+        estimate = self.ALPHA * self.M * self.M / self._inv_sum
+        if estimate <= 2.5 * self.M and self._zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = self.M * math.log(self.M / self._zeros)
+        return int(round(estimate))
+
 class ActiveHoneypotMonitor:
     def __init__(self):
-        self.connections = {}
+        # (timestamp, service, ip, active) events, newest last
+        self.connections = deque(maxlen=RECENT_CONNECTIONS)
+        self._lock = threading.Lock()
         self.stats = {
             'total_connections': 0,
-            'unique_ips': set(),
-            'services': {},
-            'start_time': datetime.now()
+            'unique_ips': UniqueCounter(),
+            'services': Counter({name: 0 for name, _ in SERVICES}),
+            'start_time': time.monotonic()
         }
         self.running = False
         
+    def render_header(self):
+        """Screen header with statistics, as a list of strings"""
+        parts = [CLEAR_SCREEN, HEADER]
+        parts.extend(self.stats_lines())
+        parts.append("\n🔍 Recent Connections:\n")
+        parts.append("-" * 70 + "\n")
+        return parts
+    
     def display_banner(self):
-        os.system('clear')
-        print("╔══════════════════════════════════════╗")
-        print("║         ACTIVE HONEYPOT MONITOR     ║")
-        print("║            Termux Edition           ║")
-        print("╚══════════════════════════════════════╝")
-        print()
-        print("🎣 Honeypot services running on:")
-        print("   • SSH: 8022 | HTTP: 8080 | FTP: 8021 | Telnet: 8023")
-        print()
-        print("📊 Statistics:")
-        self.update_stats_display()
-        print()
-        print("🔍 Recent Connections:")
-        print("-" * 70)
+        sys.stdout.write("".join(self.render_header()))
+        sys.stdout.flush()
     
     def update_display(self):
-        os.system('clear')
-        print("╔══════════════════════════════════════╗")
-        print("║         ACTIVE HONEYPOT MONITOR     ║")
-        print("║            Termux Edition           ║")
-        print("╚══════════════════════════════════════╝")
-        print()
-        print("🎣 Honeypot services running on:")
-        print("   • SSH: 8022 | HTTP: 8080 | FTP: 8021 | Telnet: 8023")
-        print()
-        print("📊 Statistics:")
-        self.update_stats_display()
-        print()
-        print("🔍 Recent Connections:")
-        print("-" * 70)
+        # Build the whole screen and emit it with one write
+        parts = self.render_header()
         
-        # Show recent connections
-        recent_connections = sorted(
-            self.connections.items(),
-            key=lambda x: x[1]['timestamp'],
-            reverse=True
-        )[:10]
-        
-        for conn_id, info in recent_connections:
-            ip = info['ip']
-            service = info['service']
-            timestamp = info['timestamp'].strftime("%H:%M:%S")
-            status = "ACTIVE" if info.get('active', False) else "CLOSED"
+        # Show recent connections, newest first
+        for ts, service, ip, active in list(self.connections)[-10:][::-1]:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(ts))
+            status = "ACTIVE" if active else "CLOSED"
             
-            print(f"[{timestamp}] {service:>6} {ip:>15} - {status}")
+            parts.append(f"[{timestamp}] {service:>6} {ip:>15} - {status}\n")
+        
+        parts.append("\n💬 Activity Log:\n")
+        parts.extend(self.recent_log_lines())
         
-        print("\n💬 Activity Log:")
-        self.print_recent_logs()
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
-    def update_stats_display(self):
-        runtime = datetime.now() - self.stats['start_time']
-        hours, remainder = divmod(runtime.total_seconds(), 3600)
+    def stats_lines(self):
+        runtime = int(time.monotonic() - self.stats['start_time'])
+        hours, remainder = divmod(runtime, 3600)
         minutes, seconds = divmod(remainder, 60)
         
-        print(f"   • Runtime: {int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}")
-        print(f"   • Total Connections: {self.stats['total_connections']}")
-        print(f"   • Unique IPs: {len(self.stats['unique_ips'])}")
-        print(f"   • Services:")
+        lines = [
+            f"   • Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}\n",
+            f"   • Total Connections: {self.stats['total_connections']}\n",
+            f"   • Unique IPs: {len(self.stats['unique_ips'])}\n",
+            f"   • Services:\n",
+        ]
         for service, count in self.stats['services'].items():
-            print(f"     - {service}: {count}")
+            lines.append(f"     - {service}: {count}\n")
+        return lines
     
-    def print_recent_logs(self):
+    def update_stats_display(self):
+        sys.stdout.write("".join(self.stats_lines()))
+        sys.stdout.flush()
+    
+    def recent_log_lines(self):
         try:
             with open("honeypot_monitor.log", "r") as f:
                 lines = f.readlines()[-5:]
-                for line in lines:
-                    print(line.strip())
+                return [line.strip() + "\n" for line in lines]
         except:
-            pass
+            return []
     
     def log_event(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         
         with open("honeypot_monitor.log", "a") as f:
@@ -98,45 +162,38 @@ class ActiveHoneypotMonitor:
         print(f"\r{log_entry}")
     
     def handle_connection(self, service_name, port, client_socket, client_ip):
-        conn_id = f"{client_ip}:{port}"
-        
-        self.connections[conn_id] = {
-            'ip': client_ip,
-            'service': service_name,
-            'timestamp': datetime.now(),
-            'active': True
-        }
+        self.connections.append((time.time(), service_name, client_ip, True))
         
-        self.stats['total_connections'] += 1
-        self.stats['unique_ips'].add(client_ip)
-        self.stats['services'][service_name] = self.stats['services'].get(service_name, 0) + 1
+        with self._lock:
+            self.stats['unique_ips'].add(client_ip)
+            self.stats['total_connections'] += 1
+            self.stats['services'][service_name] += 1
         
         self.log_event(f"🎯 {service_name} connection from {client_ip}")
         
         try:
             if service_name == "SSH":
-                client_socket.send(b"SSH-2.0-OpenSSH_8.2p1\r\n")
+                client_socket.sendall(SSH_BANNER)
                 # Simulate SSH interaction
                 time.sleep(2)
                 
             elif service_name == "HTTP":
                 request = client_socket.recv(1024).decode('utf-8', errors='ignore')
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<html><body><h1>Welcome</h1></body></html>"
-                client_socket.send(response.encode())
+                client_socket.sendall(HTTP_RESPONSE)
                 
             elif service_name == "FTP":
-                client_socket.send(b"220 FTP Server Ready\r\n")
+                client_socket.sendall(FTP_BANNER)
                 time.sleep(1)
                 
             elif service_name == "Telnet":
-                client_socket.send(b"Welcome\r\nlogin: ")
+                client_socket.sendall(TELNET_BANNER)
                 time.sleep(1)
                 
         except Exception as e:
             pass
         finally:
             client_socket.close()
-            self.connections[conn_id]['active'] = False
+            self.connections.append((time.time(), service_name, client_ip, False))
             self.log_event(f"💤 {service_name} connection closed from {client_ip}")
     
     def start_service(self, service_name, port):
@@ -144,7 +201,7 @@ class ActiveHoneypotMonitor:
             server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             server.bind(('0.0.0.0', port))
-            server.listen(10)
+            server.listen(LISTEN_BACKLOG)
             
             self.log_event(f"✅ {service_name} honeypot started on port {port}")
             
@@ -152,6 +209,9 @@ class ActiveHoneypotMonitor:
                 try:
                     client_socket, addr = server.accept()
                     client_ip = addr[0]
+                    # Send banners immediately rather than waiting on Nagle
+                    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
                     
                     thread = threading.Thread(
                         target=self.handle_connection,
@@ -169,16 +229,8 @@ class ActiveHoneypotMonitor:
     def start_monitoring(self):
         self.running = True
         
-        # Start honeypot services
-        services = [
-            ("SSH", 8022),
-            ("HTTP", 8080),
-            ("FTP", 8021),
-            ("Telnet", 8023)
-        ]
-        
-        # Start each service in a separate thread
-        for service_name, port in services:
+        # Start each honeypot service in a separate thread
+        for service_name, port in SERVICES:
             thread = threading.Thread(
                 target=self.start_service,
                 args=(service_name, port)
@@ -1,78 +1,109 @@
 #!/usr/bin/env python3
 import sqlite3
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 
+SYSTEM_IMPORT_SQL = '''
+    INSERT OR REPLACE INTO systems 
+    (id, name, hostname, port, username, auth_type, os_type, description, tags, last_seen, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+COMMAND_IMPORT_SQL = '''
+    INSERT OR REPLACE INTO commands 
+    (id, name, command, category, description)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+# Columns written by export_to_json and read back by import_from_json
+SYSTEM_EXPORT_COLUMNS = (
+    'id', 'name', 'hostname', 'port', 'username', 'auth_type',
+    'os_type', 'description', 'tags', 'last_seen', 'status'
+)
+COMMAND_EXPORT_COLUMNS = ('id', 'name', 'command', 'category', 'description')
+
 class DatabaseHandler:
     def __init__(self, db_path="systems.db"):
         self.db_path = db_path
         self.ensure_database_dir()
+        # One connection is shared by every query; the lock serializes use
+        # of it across threads
+        self._conn = self.connect()
+        self._lock = threading.Lock()
     
     def ensure_database_dir(self):
         """Ensure database directory exists"""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
     
+    def connect(self):
+        """Open a connection to the database in WAL mode"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def execute_query(self, query, params=(), fetch=False):
         """Execute a SQL query"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(query, params)
-            
-            if fetch:
-                result = cursor.fetchall()
-            else:
-                conn.commit()
-                result = None
+        with self._lock:
+            try:
+                cursor = self._conn.execute(query, params)
+                
+                if fetch:
+                    result = cursor.fetchall()
+                else:
+                    self._conn.commit()
+                    result = None
+                    
+            except Exception as e:
+                self._conn.rollback()
+                raise e
                 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
-            
         return result
     
+    def execute_many(self, query, seq_of_params):
+        """Execute a SQL statement for every parameter tuple in one transaction"""
+        self.execute_batches([(query, seq_of_params)])
+    
+    def execute_batches(self, batches):
+        """Execute several (query, seq_of_params) batches in one transaction"""
+        with self._lock, self._conn:
+            for query, seq_of_params in batches:
+                self._conn.executemany(query, seq_of_params)
+    
+    def _write_table_json(self, f, table, columns):
+        """Stream a table to f as a JSON array of objects, one row per line"""
+        query = f"SELECT {', '.join(columns)} FROM {table}"
+        f.write('[')
+        empty = True
+        with self._lock:
+            for row in self._conn.execute(query):
+                f.write('\n    ' if empty else ',\n    ')
+                f.write(json.dumps(dict(zip(columns, row))))
+                empty = False
+        f.write(']' if empty else '\n  ]')
+    
     def export_to_json(self, filename="systems_export.json"):
         """Export database to JSON file"""
-        data = {
-            'systems': [],
-            'commands': [],
-            'export_time': datetime.now().isoformat()
-        }
-        
-        # Export systems
-        systems = self.execute_query('SELECT * FROM systems', fetch=True)
-        for system in systems:
-            data['systems'].append({
-                'id': system[0],
-                'name': system[1],
-                'hostname': system[2],
-                'port': system[3],
-                'username': system[4],
-                'auth_type': system[5],
-                'os_type': system[8],
-                'description': system[9],
-                'tags': system[10],
-                'last_seen': system[11],
-                'status': system[12]
-            })
-        
-        # Export commands
-        commands = self.execute_query('SELECT * FROM commands', fetch=True)
-        for command in commands:
-            data['commands'].append({
-                'id': command[0],
-                'name': command[1],
-                'command': command[2],
-                'category': command[3],
-                'description': command[4]
-            })
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Rows are written as they are read rather than collected first
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.write('{\n  "systems": ')
+            self._write_table_json(f, 'systems', SYSTEM_EXPORT_COLUMNS)
+            f.write(',\n  "commands": ')
+            self._write_table_json(f, 'commands', COMMAND_EXPORT_COLUMNS)
+            f.write(f',\n  "export_time": {json.dumps(datetime.now().isoformat())}\n}}\n')
         
         print(f"✅ Database exported to {filename}")
     
@@ -82,29 +113,28 @@ class DatabaseHandler:
             with open(filename, 'r') as f:
                 data = json.load(f)
             
-            # Import systems
-            for system in data.get('systems', []):
-                self.execute_query('''
-                    INSERT OR REPLACE INTO systems 
-                    (id, name, hostname, port, username, auth_type, os_type, description, tags, last_seen, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            systems = [
+                (
                     system['id'], system['name'], system['hostname'], system['port'],
                     system['username'], system['auth_type'], system['os_type'],
                     system['description'], system['tags'], system['last_seen'],
                     system['status']
-                ))
-            
-            # Import commands
-            for command in data.get('commands', []):
-                self.execute_query('''
-                    INSERT OR REPLACE INTO commands 
-                    (id, name, command, category, description)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+                )
+                for system in data.get('systems', [])
+            ]
+            commands = [
+                (
                     command['id'], command['name'], command['command'],
                     command['category'], command['description']
-                ))
+                )
+                for command in data.get('commands', [])
+            ]
+            
+            # Systems and commands go in together or not at all
+            self.execute_batches([
+                (SYSTEM_IMPORT_SQL, systems),
+                (COMMAND_IMPORT_SQL, commands),
+            ])
             
             print(f"✅ Database imported from {filename}")
             
@@ -113,26 +143,23 @@ class DatabaseHandler:
     
     def get_system_stats(self):
         """Get system statistics"""
-        stats = {}
-        
-        # Total systems
-        result = self.execute_query('SELECT COUNT(*) FROM systems', fetch=True)
-        stats['total_systems'] = result[0][0] if result else 0
-        
-        # Online systems
-        result = self.execute_query('SELECT COUNT(*) FROM systems WHERE status = "online"', fetch=True)
-        stats['online_systems'] = result[0][0] if result else 0
-        
-        # Command count
-        result = self.execute_query('SELECT COUNT(*) FROM commands', fetch=True)
-        stats['total_commands'] = result[0][0] if result else 0
-        
-        # Recent activity
+        # All counts in one round-trip
         result = self.execute_query('''
-            SELECT COUNT(*) FROM command_results 
-            WHERE timestamp > datetime("now", "-1 day")
+            SELECT
+                (SELECT COUNT(*) FROM systems),
+                (SELECT COUNT(*) FROM systems WHERE status = 'online'),
+                (SELECT COUNT(*) FROM commands),
+                (SELECT COUNT(*) FROM command_results
+                 WHERE timestamp > datetime('now', '-1 day'))
         ''', fetch=True)
-        stats['recent_commands'] = result[0][0] if result else 0
+        total_systems, online_systems, total_commands, recent_commands = result[0]
+        
+        stats = {
+            'total_systems': total_systems,
+            'online_systems': online_systems,
+            'total_commands': total_commands,
+            'recent_commands': recent_commands,
+        }
         
         return stats
     
@@ -143,16 +170,21 @@ class DatabaseHandler:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = f"{backup_dir}/systems_backup_{timestamp}.db"
         
-        # Copy database file
-        import shutil
-        shutil.copy2(self.db_path, backup_file)
+        # Online backup copies a consistent snapshot, including pages
+        # still in the WAL
+        dst = sqlite3.connect(backup_file)
+        try:
+            with self._lock:
+                self._conn.backup(dst, pages=1024)
+        finally:
+            dst.close()
         
         print(f"✅ Database backed up to {backup_file}")
         return backup_file
 
 if __name__ == "__main__":
-    db = DatabaseHandler()
-    stats = db.get_system_stats()
+    with DatabaseHandler() as db:
+        stats = db.get_system_stats()
     print("📊 Database Statistics:")
     for key, value in stats.items():
         print(f"  {key}: {value}")
@@ -1,11 +1,47 @@
 #!/usr/bin/env python3
-import socket
-import threading
+import asyncio
+import atexit
 import time
 import json
 import os
+import socket
 from datetime import datetime
 
+# Seconds a client may stay idle before its session is closed
+CLIENT_TIMEOUT = 30
+
+# Log files are written through a buffer of this size and flushed at least
+# every LOG_FLUSH_INTERVAL seconds
+LOG_BUFFER_SIZE = 65536
+LOG_FLUSH_INTERVAL = 1.0
+
+# Pending-connection queue length for each listener
+LISTEN_BACKLOG = 1024
+
+# Canned service responses, encoded once
+SSH_BANNER = b"SSH-2.0-OpenSSH_8.2p1\r\n"
+FTP_BANNER = b"220 FTP Server Ready\r\n"
+FTP_USER_OK = b"331 User name okay, need password\r\n"
+FTP_PASS_OK = b"230 User logged in\r\n"
+FTP_BYE = b"221 Goodbye\r\n"
+FTP_OK = b"200 Command okay\r\n"
+TELNET_BANNER = b"Welcome\r\nlogin: "
+HTTP_BODY = b"""<html>
+<head><title>Welcome</title></head>
+<body>
+<h1>Welcome to our server</h1>
+<p>This is a test page</p>
+</body>
+</html>"""
+HTTP_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Server: nginx/1.18.0\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: close\r\n"
+    b"\r\n" % len(HTTP_BODY)
+) + HTTP_BODY
+
 class LightweightHoneypot:
     def __init__(self):
         self.ports = {
@@ -15,8 +51,19 @@ class LightweightHoneypot:
             8023: 'Telnet',
             8443: 'HTTPS'
         }
+        # Connection handler per service; others get the HTTP handler
+        self.handlers = {
+            'SSH': self.handle_ssh,
+            'HTTP': self.handle_http,
+            'FTP': self.handle_ftp,
+            'Telnet': self.handle_telnet,
+        }
         self.log_file = 'honeypot.log'
         self.setup_logging()
+        self._main_fp = open(self.log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+        self._daily_fp = None
+        self._daily_until = 0.0  # local midnight ending the open daily log
+        atexit.register(self.flush_logs)
         
     def setup_logging(self):
         if not os.path.exists('logs'):
@@ -29,164 +76,198 @@ class LightweightHoneypot:
             log_entry += f" - {data}"
         
         print(log_entry)
-        with open(self.log_file, 'a') as f:
-            f.write(log_entry + '\n')
+        line = (log_entry + '\n').encode('utf-8')
+        self._main_fp.write(line)
             
         # Also log to daily file
-        daily_file = f"logs/honeypot_{datetime.now().strftime('%Y%m%d')}.log"
-        with open(daily_file, 'a') as f:
-            f.write(log_entry + '\n')
+        now = time.time()
+        if now >= self._daily_until:
+            self._open_daily_log(now)
+        self._daily_fp.write(line)
+
+    def _open_daily_log(self, now):
+        """Switch to the buffered daily log for the day containing now"""
+        if self._daily_fp is not None:
+            self._daily_fp.close()
+        lt = time.localtime(now)
+        day = time.strftime('%Y%m%d', lt)
+        self._daily_fp = open(f"logs/honeypot_{day}.log", 'ab', buffering=LOG_BUFFER_SIZE)
+        self._daily_until = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+    def flush_logs(self):
+        """Write buffered log lines to disk"""
+        for fp in (self._main_fp, self._daily_fp):
+            if fp is not None and not fp.closed:
+                fp.flush()
+
+    async def flush_logs_periodically(self):
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            self.flush_logs()
     
-    def handle_ssh(self, client_socket, client_ip, client_port):
+    @staticmethod
+    def peer(writer):
+        """Get (ip, port) of the client behind a stream writer"""
+        return writer.get_extra_info('peername')[:2]
+
+    @staticmethod
+    async def read(reader, size):
+        """Read up to size bytes, returning b'' on EOF or idle timeout"""
+        try:
+            return await asyncio.wait_for(reader.read(size), timeout=CLIENT_TIMEOUT)
+        except asyncio.TimeoutError:
+            return b""
+
+    @staticmethod
+    async def close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def handle_ssh(self, reader, writer):
+        client_ip, client_port = self.peer(writer)
         self.log_event("SSH_CONNECTION", client_ip, client_port)
         try:
-            client_socket.send(b"SSH-2.0-OpenSSH_8.2p1\r\n")
-            client_socket.settimeout(30)
+            writer.write(SSH_BANNER)
+            await writer.drain()
             
             while True:
-                try:
-                    data = client_socket.recv(1024)
-                    if not data:
-                        break
-                    self.log_event("SSH_DATA", client_ip, client_port, data.decode('utf-8', errors='ignore')[:100])
-                    
-                    # Simulate SSH behavior
-                    if b"SSH" in data.upper():
-                        client_socket.send(b"SSH-2.0-OpenSSH_8.2p1\r\n")
-                    elif b"USER" in data.upper():
-                        client_socket.send(b"Password: ")
-                    else:
-                        client_socket.send(b"Permission denied\r\nPassword: ")
-                        
-                except socket.timeout:
+                data = await self.read(reader, 1024)
+                if not data:
                     break
+                self.log_event("SSH_DATA", client_ip, client_port, data.decode('utf-8', errors='ignore')[:100])
+                    
+                # Simulate SSH behavior
+                if b"SSH" in data.upper():
+                    writer.write(SSH_BANNER)
+                elif b"USER" in data.upper():
+                    writer.write(b"Password: ")
+                else:
+                    writer.write(b"Permission denied\r\nPassword: ")
+                await writer.drain()
                     
         except Exception as e:
             self.log_event("SSH_ERROR", client_ip, client_port, str(e))
         finally:
-            client_socket.close()
+            await self.close(writer)
             self.log_event("SSH_DISCONNECT", client_ip, client_port)
     
-    def handle_http(self, client_socket, client_ip, client_port):
+    async def handle_http(self, reader, writer):
+        client_ip, client_port = self.peer(writer)
         try:
-            request = client_socket.recv(4096).decode('utf-8', errors='ignore')
+            request = (await self.read(reader, 4096)).decode('utf-8', errors='ignore')
             lines = request.split('\n')
             if lines:
                 first_line = lines[0].strip()
                 self.log_event("HTTP_REQUEST", client_ip, client_port, first_line)
             
             # Send realistic response
-            response = """HTTP/1.1 200 OK
-Server: nginx/1.18.0
-Content-Type: text/html
-
-<html>
-<head><title>Welcome</title></head>
-<body>
-<h1>Welcome to our server</h1>
-<p>This is a test page</p>
-</body>
-</html>"""
-            client_socket.send(response.encode())
+            writer.write(HTTP_RESPONSE)
+            await writer.drain()
             
         except Exception as e:
             self.log_event("HTTP_ERROR", client_ip, client_port, str(e))
         finally:
-            client_socket.close()
+            await self.close(writer)
     
-    def handle_ftp(self, client_socket, client_ip, client_port):
+    async def handle_ftp(self, reader, writer):
+        client_ip, client_port = self.peer(writer)
         self.log_event("FTP_CONNECTION", client_ip, client_port)
         try:
-            client_socket.send(b"220 FTP Server Ready\r\n")
-            client_socket.settimeout(30)
+            writer.write(FTP_BANNER)
+            await writer.drain()
             
             while True:
-                try:
-                    data = client_socket.recv(1024)
-                    if not data:
-                        break
-                    command = data.decode('utf-8', errors='ignore').strip()
-                    self.log_event("FTP_COMMAND", client_ip, client_port, command)
+                data = await self.read(reader, 1024)
+                if not data:
+                    break
+                # Log a bounded copy; dispatch on the raw command bytes
+                self.log_event("FTP_COMMAND", client_ip, client_port,
+                               data[:128].decode('ascii', 'replace').strip())
                     
-                    if command.upper().startswith("USER"):
-                        client_socket.send(b"331 User name okay, need password\r\n")
-                    elif command.upper().startswith("PASS"):
-                        client_socket.send(b"230 User logged in\r\n")
-                    elif command.upper().startswith("QUIT"):
-                        client_socket.send(b"221 Goodbye\r\n")
-                        break
-                    else:
-                        client_socket.send(b"200 Command okay\r\n")
-                        
-                except socket.timeout:
+                head = data[:4].upper()
+                if head == b"USER":
+                    writer.write(FTP_USER_OK)
+                elif head == b"PASS":
+                    writer.write(FTP_PASS_OK)
+                elif head == b"QUIT":
+                    writer.write(FTP_BYE)
+                    await writer.drain()
                     break
+                else:
+                    writer.write(FTP_OK)
+                await writer.drain()
                     
         except Exception as e:
             self.log_event("FTP_ERROR", client_ip, client_port, str(e))
         finally:
-            client_socket.close()
+            await self.close(writer)
             self.log_event("FTP_DISCONNECT", client_ip, client_port)
     
-    def handle_telnet(self, client_socket, client_ip, client_port):
+    async def handle_telnet(self, reader, writer):
+        client_ip, client_port = self.peer(writer)
         self.log_event("TELNET_CONNECTION", client_ip, client_port)
         try:
-            client_socket.send(b"Welcome\r\nlogin: ")
-            client_socket.settimeout(30)
+            writer.write(TELNET_BANNER)
+            await writer.drain()
             
             state = "username"
             while True:
-                try:
-                    data = client_socket.recv(1024)
-                    if not data:
-                        break
+                data = await self.read(reader, 1024)
+                if not data:
+                    break
                     
-                    self.log_event("TELNET_INPUT", client_ip, client_port, data.decode('utf-8', errors='ignore').strip())
+                self.log_event("TELNET_INPUT", client_ip, client_port, data.decode('utf-8', errors='ignore').strip())
                     
-                    if state == "username":
-                        client_socket.send(b"Password: ")
-                        state = "password"
-                    else:
-                        client_socket.send(b"Login incorrect\r\nlogin: ")
-                        state = "username"
-                        
-                except socket.timeout:
-                    break
+                if state == "username":
+                    writer.write(b"Password: ")
+                    state = "password"
+                else:
+                    writer.write(b"Login incorrect\r\nlogin: ")
+                    state = "username"
+                await writer.drain()
                     
         except Exception as e:
             self.log_event("TELNET_ERROR", client_ip, client_port, str(e))
         finally:
-            client_socket.close()
+            await self.close(writer)
     
-    def start_service(self, port, service_name):
+    async def start_service(self, port, service_name):
+        """Start listening for one service; returns the server, or None on error"""
+        handler = self.handlers.get(service_name, self.handle_http)
+
+        async def serve(reader, writer):
+            # asyncio already disables Nagle on TCP streams; also detect
+            # dead peers so idle sessions are not kept open forever
+            sock = writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            await handler(reader, writer)
+
         try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server.bind(('0.0.0.0', port))
-            server.listen(5)
-            
+            server = await asyncio.start_server(serve, '0.0.0.0', port, reuse_address=True,
+                                                backlog=LISTEN_BACKLOG)
             print(f"[+] {service_name} honeypot listening on port {port}")
-            
-            while True:
-                client_socket, addr = server.accept()
-                client_ip, client_port = addr
-                
-                if service_name == 'SSH':
-                    handler = self.handle_ssh
-                elif service_name == 'HTTP':
-                    handler = self.handle_http
-                elif service_name == 'FTP':
-                    handler = self.handle_ftp
-                elif service_name == 'Telnet':
-                    handler = self.handle_telnet
-                else:
-                    handler = self.handle_http
-                
-                thread = threading.Thread(target=handler, args=(client_socket, client_ip, client_port))
-                thread.daemon = True
-                thread.start()
-                
+            return server
         except Exception as e:
             print(f"Error in {service_name} service: {e}")
+            return None
+
+    async def serve_all(self):
+        """Run every service on this event loop until cancelled"""
+        servers = []
+        for port, service in self.ports.items():
+            server = await self.start_service(port, service)
+            if server:
+                servers.append(server)
+
+        if servers:
+            await asyncio.gather(
+                self.flush_logs_periodically(),
+                *(server.serve_forever() for server in servers)
+            )
     
     def start_all(self):
         print("[+] Starting lightweight honeypot...")
@@ -194,19 +275,13 @@ Content-Type: text/html
         print("[+] Logs: honeypot.log, logs/honeypot_YYYYMMDD.log")
         print("[+] Press Ctrl+C to stop")
         
-        threads = []
-        for port, service in self.ports.items():
-            thread = threading.Thread(target=self.start_service, args=(port, service))
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-            time.sleep(0.1)
-        
+        # All connections are served as coroutines on one event loop thread
         try:
-            while True:
-                time.sleep(1)
+            asyncio.run(self.serve_all())
         except KeyboardInterrupt:
             print("\n[!] Stopping honeypot...")
+        finally:
+            self.flush_logs()
 
 if __name__ == "__main__":
     honeypot = LightweightHoneypot()
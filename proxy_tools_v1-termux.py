@@ -24,6 +24,17 @@ class TermuxProxyTester:
         self.proxies = []
         self.testing = False
         self.colors = self.setup_colors()
+        self._dispatch = {
+            '1': self.add_proxy_manual,
+            '2': self.load_from_file,
+            '3': self.test_all_proxies,
+            '4': self.discover_proxies,
+            '5': self.test_home_api,
+            '6': self.view_proxy_list,
+            '7': self.filter_manage_proxies,
+            '8': self.export_proxies,
+            '9': self.show_settings,
+        }
         
     def setup_colors(self):
         """Setup terminal colors"""
@@ -699,27 +710,13 @@ class TermuxProxyTester:
             if choice == '0':
                 print(f"\n{self.colors['GREEN']}Thank you for using Termux Proxy Tester!{self.colors['RESET']}")
                 break
-            elif choice == '1':
-                self.add_proxy_manual()
-            elif choice == '2':
-                self.load_from_file()
-            elif choice == '3':
-                self.test_all_proxies()
-            elif choice == '4':
-                self.discover_proxies()
-            elif choice == '5':
-                self.test_home_api()
-            elif choice == '6':
-                self.view_proxy_list()
-            elif choice == '7':
-                self.filter_manage_proxies()
-            elif choice == '8':
-                self.export_proxies()
-            elif choice == '9':
-                self.show_settings()
-            else:
+
+            handler = self._dispatch.get(choice)
+            if handler is None:
                 print(f"{self.colors['RED']}Invalid choice!{self.colors['RESET']}")
                 input(f"{self.colors['YELLOW']}Press Enter to continue...{self.colors['RESET']}")
+                continue
+            handler()
 
     def show_settings(self):
         """Show settings menu"""
@@ -1,164 +1,245 @@
 #!/usr/bin/env python3
 import asyncio
+import heapq
+import itertools
 import json
+import logging
+import sys
 import time
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 from bleak import BleakScanner
 import threading
 import os
 
+LOG_FILE = "bluetooth_monitor.log"
+KNOWN_DEVICES_FILE = "known_devices.json"
+# The log rotates at LOG_MAX_BYTES, keeping LOG_BACKUPS old files
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUPS = 2
+# Bytes read back from the end of the log to show its last lines
+LOG_TAIL_BYTES = 4096
+# Seconds between screen refreshes while the scanner runs
+REFRESH_INTERVAL = 5
+# Seconds without an advertisement before a device is reported lost
+LOST_AFTER = 30
+# ANSI: clear the screen, cursor home
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+# ANSI: cursor home, erase to the end of the screen
+REDRAW = "\x1b[H\x1b[J"
+# Device table row, bound once instead of parsing the format every row
+ROW_FORMAT = "{:<18} {:<25} {:<8} {:<12}".format
+# Static screen parts, built once
+BANNER = (
+    "╔══════════════════════════════════════╗\n"
+    "║       REAL-TIME BLUETOOTH MONITOR   ║\n"
+    "║            Termux Edition           ║\n"
+    "╚══════════════════════════════════════╝\n"
+    "\n"
+)
+HINTS = (
+    "🔄 Scanning continuously\n"
+    "💡 Press Ctrl+C to stop\n"
+    "\n"
+)
+TABLE_RULE = "-" * 70
+# No trailing newline: update_display joins the frame's lines with "\n"
+TABLE_HEADER = ROW_FORMAT("MAC Address", "Device Name", "RSSI", "Status") + "\n" + TABLE_RULE
+
 class RealTimeBluetoothMonitor:
-    def __init__(self):
+    def __init__(self, service_uuids=None, or_patterns=None):
+        # When set, only devices advertising one of these service UUIDs are
+        # reported; the Bluetooth stack filters the rest before Python sees them
+        self.service_uuids = service_uuids
+        # BlueZ advertisement patterns; when set, scanning is passive
+        self.or_patterns = or_patterns
+        # Kept in last-seen order: a device is moved to the end whenever it
+        # is seen again, so the most recent ones are at the end
         self.discovered_devices = {}
+        # (last_seen, mac) with one entry per device not yet reported lost;
+        # an entry may be older than the device's real last_seen
+        self._last_seen_heap = []
         self.known_devices = self.load_known_devices()
+        self._known_dirty = False  # known_devices changed since the last save
         self.running = False
+        self._new_devices = False  # set by _on_adv, cleared on redraw
+        self._log_file_handler = RotatingFileHandler(
+            LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+        )
+        # Buffered; flushed once per scan cycle and on exit
+        self._log_handler = MemoryHandler(
+            capacity=256, flushLevel=logging.CRITICAL, target=self._log_file_handler
+        )
+        self.logger = logging.getLogger("bluetooth_monitor")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self._log_handler)
         
     def load_known_devices(self):
         try:
-            with open("known_devices.json", "r") as f:
-                return set(json.load(f))
+            with open(KNOWN_DEVICES_FILE, "rb") as f:
+                return set(json.loads(f.read()))
         except:
             return set()
     
     def save_known_devices(self):
-        with open("known_devices.json", "w") as f:
-            json.dump(list(self.known_devices), f)
+        """Write the known devices, only if they changed since the last save"""
+        if not self._known_dirty:
+            return
+        # Replace the file in one step so a crash never leaves it half written
+        tmp = KNOWN_DEVICES_FILE + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(json.dumps(list(self.known_devices)))
+        os.replace(tmp, KNOWN_DEVICES_FILE)
+        self._known_dirty = False
     
     def display_banner(self):
-        os.system('clear')
-        print("╔══════════════════════════════════════╗")
-        print("║       REAL-TIME BLUETOOTH MONITOR   ║")
-        print("║            Termux Edition           ║")
-        print("╚══════════════════════════════════════╝")
-        print()
-        print("📱 Monitoring for Bluetooth devices...")
-        print("🔄 Scanning every 5 seconds")
-        print("💡 Press Ctrl+C to stop")
-        print()
-        print("{:<18} {:<25} {:<8} {:<12}".format(
-            "MAC Address", "Device Name", "RSSI", "First Seen"
-        ))
-        print("-" * 70)
+        sys.stdout.write(
+            CLEAR_SCREEN + BANNER
+            + "📱 Monitoring for Bluetooth devices...\n" + HINTS
+            + ROW_FORMAT("MAC Address", "Device Name", "RSSI", "First Seen") + "\n" + TABLE_RULE + "\n"
+        )
+        sys.stdout.flush()
     
     def update_display(self):
-        os.system('clear')
-        print("╔══════════════════════════════════════╗")
-        print("║       REAL-TIME BLUETOOTH MONITOR   ║")
-        print("║            Termux Edition           ║")
-        print("╚══════════════════════════════════════╝")
-        print()
-        print(f"📱 Monitoring - Found {len(self.discovered_devices)} devices")
-        print("🔄 Scanning every 5 seconds")
-        print("💡 Press Ctrl+C to stop")
-        print()
-        print("{:<18} {:<25} {:<8} {:<12}".format(
-            "MAC Address", "Device Name", "RSSI", "Status"
-        ))
-        print("-" * 70)
+        # Build the whole screen, then emit it with one write
+        rows = [
+            REDRAW + BANNER
+            + f"📱 Monitoring - Found {len(self.discovered_devices)} devices\n"
+            + HINTS + TABLE_HEADER
+        ]
         
-        # Sort by most recently seen
-        sorted_devices = sorted(
-            self.discovered_devices.items(), 
-            key=lambda x: x[1]['last_seen'], 
-            reverse=True
-        )
+        # Most recently seen first
+        recent_devices = itertools.islice(reversed(self.discovered_devices.items()), 15)
         
-        for mac, info in sorted_devices[:15]:  # Show top 15
+        for mac, info in recent_devices:  # Show top 15
             name = info['name'][:24] if info['name'] else "Unknown"
             rssi = info['rssi'] if info['rssi'] else "N/A"
             status = "🆕 NEW!" if info['new'] else "✅ Known"
             
-            print("{:<18} {:<25} {:<8} {:<12}".format(
-                mac[:17], name, rssi, status
-            ))
+            rows.append(ROW_FORMAT(mac[:17], name, rssi, status))
         
-        print("\n💬 Log:")
-        self.print_recent_logs()
+        rows.append("\n💬 Log:")
+        rows.extend(self.recent_log_lines())
+        
+        sys.stdout.write("\n".join(rows) + "\n")
+        sys.stdout.flush()
     
-    def print_recent_logs(self):
+    def recent_log_lines(self):
+        """Last 5 lines of the log file"""
         try:
-            with open("bluetooth_monitor.log", "r") as f:
-                lines = f.readlines()[-5:]  # Last 5 lines
-                for line in lines:
-                    print(line.strip())
+            with open(LOG_FILE, "rb") as f:
+                # Only read the end of the file, however large it is
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - LOG_TAIL_BYTES))
+                lines = f.read().decode("utf-8", errors="replace").splitlines()[-5:]
+                return [line.strip() for line in lines]
         except:
-            pass
+            return []
     
     def log_event(self, message):
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         
-        with open("bluetooth_monitor.log", "a") as f:
-            f.write(log_entry + "\n")
+        self.logger.info(log_entry)
         
         print(f"\r{log_entry}")
     
-    async def scan_ble_devices(self):
-        try:
-            devices = await BleakScanner.discover(timeout=5.0, return_adv=True)
-            
-            current_scan_macs = set()
-            new_devices_found = False
-            
-            for device, advertising_data in devices.values():
-                mac = device.address
-                name = device.name or "Unknown"
-                rssi = advertising_data.rssi if advertising_data else None
-                
-                current_scan_macs.add(mac)
-                
-                if mac not in self.discovered_devices:
-                    # New device
-                    self.discovered_devices[mac] = {
-                        'name': name,
-                        'rssi': rssi,
-                        'first_seen': datetime.now().strftime("%H:%M:%S"),
-                        'last_seen': time.time(),
-                        'new': True
-                    }
-                    self.log_event(f"🆕 NEW DEVICE: {name} ({mac}) RSSI: {rssi}")
-                    new_devices_found = True
-                    
-                else:
-                    # Update existing device
-                    self.discovered_devices[mac]['last_seen'] = time.time()
-                    self.discovered_devices[mac]['rssi'] = rssi
-                    if self.discovered_devices[mac]['new']:
-                        self.discovered_devices[mac]['new'] = False
-            
-            # Check for disappeared devices
-            disappeared = set(self.discovered_devices.keys()) - current_scan_macs
-            for mac in disappeared:
-                if time.time() - self.discovered_devices[mac]['last_seen'] > 30:
-                    name = self.discovered_devices[mac]['name']
-                    self.log_event(f"📵 DEVICE LOST: {name} ({mac})")
-                    # Keep in discovered devices but mark as old
-            
-            return new_devices_found
+    def flush_log(self):
+        self._log_handler.flush()
+    
+    def _on_adv(self, device, advertising_data):
+        """Scanner callback, called for every advertisement received"""
+        mac = device.address
+        rssi = advertising_data.rssi if advertising_data else None
+        now = time.time()
+        
+        if mac not in self.discovered_devices:
+            # New device
+            name = device.name or "Unknown"
+            self.discovered_devices[mac] = {
+                'name': name,
+                'rssi': rssi,
+                'first_seen': datetime.now().strftime("%H:%M:%S"),
+                'found_at': now,
+                'last_seen': now,
+                'new': True,
+                'lost': False
+            }
+            heapq.heappush(self._last_seen_heap, (now, mac))
+            self.log_event(f"🆕 NEW DEVICE: {name} ({mac}) RSSI: {rssi}")
+            self._new_devices = True
+            if mac not in self.known_devices:
+                self.known_devices.add(mac)
+                self._known_dirty = True
             
-        except Exception as e:
-            self.log_event(f"❌ Scan error: {str(e)}")
-            return False
+        else:
+            # Update existing device, moving it to the most recent end
+            info = self.discovered_devices.pop(mac)
+            info['last_seen'] = now
+            info['rssi'] = rssi
+            # Shown as new until it is seen again after the next refresh
+            if info['new'] and now - info['found_at'] > REFRESH_INTERVAL:
+                info['new'] = False
+            if info['lost']:
+                # Back in range; watch it again
+                info['lost'] = False
+                heapq.heappush(self._last_seen_heap, (now, mac))
+            self.discovered_devices[mac] = info
+    
+    def scanner_kwargs(self):
+        """BleakScanner arguments for the configured filters"""
+        kwargs = {'detection_callback': self._on_adv}
+        if self.service_uuids:
+            kwargs['service_uuids'] = self.service_uuids
+        if self.or_patterns:
+            # BlueZ only allows passive scanning with match patterns
+            kwargs['scanning_mode'] = 'passive'
+            kwargs['bluez'] = {'or_patterns': self.or_patterns}
+        return kwargs
+    
+    def check_lost_devices(self):
+        """Report devices not seen for LOST_AFTER seconds, once per loss"""
+        heap = self._last_seen_heap
+        cutoff = time.time() - LOST_AFTER
+        # Only entries older than the cutoff are looked at
+        while heap and heap[0][0] < cutoff:
+            ts, mac = heapq.heappop(heap)
+            info = self.discovered_devices[mac]
+            if info['last_seen'] > ts:
+                # Seen since this entry was pushed; requeue at its real time
+                heapq.heappush(heap, (info['last_seen'], mac))
+                continue
+            self.log_event(f"📵 DEVICE LOST: {info['name']} ({mac})")
+            # Keep in discovered devices but mark as old
+            info['lost'] = True
     
     async def continuous_scan(self):
         self.running = True
-        scan_count = 0
+        refresh_count = 0
         
         self.display_banner()
         
         while self.running:
             try:
-                scan_count += 1
-                new_devices = await self.scan_ble_devices()
-                
-                if new_devices or scan_count % 3 == 0:
-                    self.update_display()
-                
-                await asyncio.sleep(5)
+                # One scanner stays up for the whole session and reports each
+                # advertisement to _on_adv; this loop only refreshes the screen
+                async with BleakScanner(**self.scanner_kwargs()):
+                    while self.running:
+                        await asyncio.sleep(REFRESH_INTERVAL)
+                        refresh_count += 1
+                        self.check_lost_devices()
+                        self.flush_log()
+                        self.save_known_devices()
+                        
+                        if self._new_devices or refresh_count % 3 == 0:
+                            self._new_devices = False
+                            self.update_display()
                 
             except Exception as e:
-                self.log_event(f"❌ Continuous scan error: {str(e)}")
-                await asyncio.sleep(5)
+                self.log_event(f"❌ Scan error: {str(e)}")
+                self.flush_log()
+                await asyncio.sleep(REFRESH_INTERVAL)
     
     def start(self):
         try:
@@ -166,10 +247,12 @@ class RealTimeBluetoothMonitor:
         except KeyboardInterrupt:
             self.running = False
             self.log_event("🛑 Monitoring stopped by user")
+            self._log_handler.close()
+            self._log_file_handler.close()
             self.save_known_devices()
             print("\n\n💾 Results saved to:")
-            print("   - bluetooth_monitor.log")
-            print("   - known_devices.json")
+            print(f"   - {LOG_FILE}")
+            print(f"   - {KNOWN_DEVICES_FILE}")
             print("\n📊 Summary:")
             print(f"   Total devices found: {len(self.discovered_devices)}")
 
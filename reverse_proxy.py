@@ -10,26 +10,32 @@ Features:
 - Traffic statistics and logging
 """
 
+import http.client
 import http.server
 import socketserver
 import threading
+import concurrent.futures
 import time
 import json
+import base64
 import logging
+import logging.handlers
 import socket
+import select
 import ssl
 import urllib.parse
-import urllib.request
-import urllib.error
 import random
 import argparse
+from array import array
 from datetime import datetime
-from collections import deque
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Tuple
+from enum import IntEnum
+from typing import Optional, Dict, Iterable, List, Tuple
 import os
 import sys
 import signal
+import multiprocessing
 import queue
 
 
@@ -44,12 +50,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class ProxyType(IntEnum):
+    """Proxy types accepted by the pool"""
+    HTTP = 0
+    HTTPS = 1
+    SOCKS4 = 2
+    SOCKS5 = 3
+
+
+# URL scheme / display name for each ProxyType, indexed by value
+PROXY_TYPE_NAMES = ("http", "https", "socks4", "socks5")
+
+# Headers that apply to a single connection and are not forwarded; 'host'
+# is replaced with the target's own value
+HOP_BY_HOP = frozenset({
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade', 'host',
+})
+
+# Size of each read/write when streaming request and response bodies
+CHUNK_SIZE = 64 * 1024
+
+# Seconds a client connection may sit idle before its worker drops it, so
+# idle keep-alive clients cannot hold every worker
+CLIENT_IDLE_TIMEOUT = 30
+
+
 @dataclass
 class ProxyEntry:
     """Represents a proxy server in the pool"""
     host: str
     port: int
-    proxy_type: str = "http"  # http, https, socks4, socks5
+    proxy_type: ProxyType = ProxyType.HTTP
     username: Optional[str] = None
     password: Optional[str] = None
     is_active: bool = True
@@ -57,28 +89,45 @@ class ProxyEntry:
     failure_count: int = 0
     last_used: Optional[float] = None
     last_validated: Optional[float] = None
-    response_times: List[float] = field(default_factory=list)
+    # Only the last 100 response times are kept
+    response_times: deque = field(default_factory=lambda: deque(maxlen=100))
 
-    def get_url(self) -> str:
-        """Get proxy URL for requests"""
+    def __post_init__(self):
+        # Address and credentials don't change after creation, so format
+        # the derived strings once instead of on every request
+        self._url = self._build_url()
+        self._auth_header = self._build_auth_header()
+
+    def _build_url(self) -> str:
         auth = ""
         if self.username and self.password:
             auth = f"{self.username}:{self.password}@"
-        return f"{self.proxy_type}://{auth}{self.host}:{self.port}"
+        return f"{PROXY_TYPE_NAMES[self.proxy_type]}://{auth}{self.host}:{self.port}"
 
-    def record_success(self, response_time: float):
-        """Record a successful request"""
+    def _build_auth_header(self) -> Optional[str]:
+        if not (self.username and self.password):
+            return None
+        token = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        return f"Basic {token}"
+
+    def get_url(self) -> str:
+        """Get proxy URL for requests"""
+        return self._url
+
+    def get_auth_header(self) -> Optional[str]:
+        """Get the Proxy-Authorization header value, if credentials are set"""
+        return self._auth_header
+
+    def record_success(self, response_time: float, now: Optional[float] = None):
+        """Record a successful request (now: wall-clock time, if already known)"""
         self.success_count += 1
-        self.last_used = time.time()
+        self.last_used = time.time() if now is None else now
         self.response_times.append(response_time)
-        # Keep only last 100 response times
-        if len(self.response_times) > 100:
-            self.response_times = self.response_times[-100:]
 
-    def record_failure(self):
-        """Record a failed request"""
+    def record_failure(self, now: Optional[float] = None):
+        """Record a failed request (now: wall-clock time, if already known)"""
         self.failure_count += 1
-        self.last_used = time.time()
+        self.last_used = time.time() if now is None else now
 
     def get_success_rate(self) -> float:
         """Calculate success rate"""
@@ -98,7 +147,7 @@ class ProxyEntry:
         return {
             "host": self.host,
             "port": self.port,
-            "proxy_type": self.proxy_type,
+            "proxy_type": PROXY_TYPE_NAMES[self.proxy_type],
             "is_active": self.is_active,
             "success_count": self.success_count,
             "failure_count": self.failure_count,
@@ -109,19 +158,28 @@ class ProxyEntry:
         }
 
 
-@dataclass
-class TrafficStats:
-    """Traffic statistics for monitoring"""
-    total_requests: int = 0
-    successful_requests: int = 0
-    failed_requests: int = 0
-    bytes_received: int = 0
-    bytes_sent: int = 0
-    start_time: float = field(default_factory=time.time)
-    requests_per_minute: deque = field(default_factory=lambda: deque(maxlen=60))
+class _TrafficShard:
+    """One handler thread's share of the traffic counters
+    
+    Only the owning thread writes a shard, so recording a request touches
+    no shared state; readers sum over all shards.
+    """
     
-    def record_request(self, success: bool, bytes_in: int, bytes_out: int):
-        """Record a request"""
+    __slots__ = ("total_requests", "successful_requests", "failed_requests",
+                 "bytes_received", "bytes_sent", "rpm_minutes", "rpm_counts")
+    
+    def __init__(self):
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        # Ring of the last 60 minutes, indexed by minute % 60: the minute each
+        # slot belongs to and the request count within it
+        self.rpm_minutes = array('q', [-1] * 60)
+        self.rpm_counts = array('q', [0] * 60)
+    
+    def record_request(self, success: bool, bytes_in: int, bytes_out: int, now: float):
         self.total_requests += 1
         if success:
             self.successful_requests += 1
@@ -131,11 +189,75 @@ class TrafficStats:
         self.bytes_sent += bytes_out
         
         # Track requests per minute
-        current_minute = int(time.time() / 60)
-        if self.requests_per_minute and self.requests_per_minute[-1][0] == current_minute:
-            self.requests_per_minute[-1] = (current_minute, self.requests_per_minute[-1][1] + 1)
-        else:
-            self.requests_per_minute.append((current_minute, 1))
+        current_minute = int(now // 60)
+        idx = current_minute % 60
+        if self.rpm_minutes[idx] != current_minute:
+            self.rpm_minutes[idx] = current_minute
+            self.rpm_counts[idx] = 0
+        self.rpm_counts[idx] += 1
+
+
+@dataclass
+class TrafficStats:
+    """Traffic statistics for monitoring
+    
+    Counters are kept per thread and merged when read, so concurrent
+    handlers never contend on (or lose updates to) shared totals.
+    """
+    start_time: float = field(default_factory=time.time)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _shards: List[_TrafficShard] = field(default_factory=list, repr=False)
+    _shards_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
+    def _shard(self) -> _TrafficShard:
+        """Get the calling thread's shard, creating it on first use"""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _TrafficShard()
+            self._local.shard = shard
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+    
+    def record_request(self, success: bool, bytes_in: int, bytes_out: int,
+                       now: Optional[float] = None):
+        """Record a request (now: wall-clock time, if already known)"""
+        self._shard().record_request(
+            success, bytes_in, bytes_out, time.time() if now is None else now
+        )
+    
+    def _sum(self, name: str) -> int:
+        return sum(getattr(shard, name) for shard in tuple(self._shards))
+    
+    @property
+    def total_requests(self) -> int:
+        return self._sum("total_requests")
+    
+    @property
+    def successful_requests(self) -> int:
+        return self._sum("successful_requests")
+    
+    @property
+    def failed_requests(self) -> int:
+        return self._sum("failed_requests")
+    
+    @property
+    def bytes_received(self) -> int:
+        return self._sum("bytes_received")
+    
+    @property
+    def bytes_sent(self) -> int:
+        return self._sum("bytes_sent")
+
+    def get_requests_per_minute(self) -> List[Tuple[int, int]]:
+        """Get (minute, request count) pairs for the last 60 minutes, oldest first"""
+        oldest = int(time.time() // 60) - 59
+        per_minute: Dict[int, int] = {}
+        for shard in tuple(self._shards):
+            for minute, count in zip(shard.rpm_minutes, shard.rpm_counts):
+                if minute >= oldest:
+                    per_minute[minute] = per_minute.get(minute, 0) + count
+        return sorted(per_minute.items())
 
     def get_uptime(self) -> float:
         """Get uptime in seconds"""
@@ -150,11 +272,13 @@ class TrafficStats:
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
+        total_requests = self.total_requests
+        successful_requests = self.successful_requests
         return {
-            "total_requests": self.total_requests,
-            "successful_requests": self.successful_requests,
+            "total_requests": total_requests,
+            "successful_requests": successful_requests,
             "failed_requests": self.failed_requests,
-            "success_rate": round(self.successful_requests / max(1, self.total_requests) * 100, 2),
+            "success_rate": round(successful_requests / max(1, total_requests) * 100, 2),
             "bytes_received": self.bytes_received,
             "bytes_sent": self.bytes_sent,
             "uptime_seconds": round(self.get_uptime(), 2),
@@ -162,6 +286,38 @@ class TrafficStats:
         }
 
 
+def open_upstream_connection(proxy: Optional[ProxyEntry], target_host: str, target_port: int,
+                             scheme: str, timeout: float,
+                             ssl_context: Optional[ssl.SSLContext] = None) -> http.client.HTTPConnection:
+    """Create an (unconnected) HTTP connection to a target, directly or via a proxy
+    
+    Plain HTTP through a proxy talks to the proxy itself and expects an
+    absolute request URL; HTTPS is tunnelled to the target with CONNECT.
+    """
+    if not proxy:
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                target_host, target_port, timeout=timeout, context=ssl_context
+            )
+        return http.client.HTTPConnection(target_host, target_port, timeout=timeout)
+    
+    if proxy.proxy_type > ProxyType.HTTPS:
+        raise ConnectionError(
+            f"{PROXY_TYPE_NAMES[proxy.proxy_type]} proxies are not supported for forwarding"
+        )
+    
+    if scheme == "https":
+        # Tunnel TLS to the target through the proxy with CONNECT
+        conn = http.client.HTTPSConnection(
+            proxy.host, proxy.port, timeout=timeout, context=ssl_context
+        )
+        auth = proxy.get_auth_header()
+        conn.set_tunnel(target_host, target_port,
+                        headers={'Proxy-Authorization': auth} if auth else None)
+        return conn
+    return http.client.HTTPConnection(proxy.host, proxy.port, timeout=timeout)
+
+
 class ProxyPool:
     """Manages a pool of proxy servers with rotation"""
     
@@ -172,11 +328,22 @@ class ProxyPool:
         self.current_proxy_index = 0
         self.last_rotation = time.time()
         self._lock = threading.Lock()
-        self._running = False
+        # Snapshot of active proxies, rebuilt under the lock whenever
+        # membership or is_active changes so readers never need the lock
+        self._active: Tuple[ProxyEntry, ...] = ()
+        # (host, port) -> ProxyEntry for O(1) duplicate checks and removal
+        self._by_endpoint: Dict[Tuple[str, int], ProxyEntry] = {}
+        # Bumped on every _rebuild_active; invalidates the get_stats cache
+        self._generation = 0
+        self._stats_cache: Tuple[int, float, Optional[List[dict]]] = (-1, 0.0, None)
+        # Set by stop(); the background loops wait on it so they exit at once
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._rotation_thread: Optional[threading.Thread] = None
         self._validation_thread: Optional[threading.Thread] = None
         self.validation_url = "http://httpbin.org/ip"
         self.validation_timeout = 10
+        self.max_validation_workers = 32
 
     def add_proxy(self, host: str, port: int, proxy_type: str = "http",
                   username: Optional[str] = None, password: Optional[str] = None) -> bool:
@@ -193,55 +360,92 @@ class ProxyPool:
             True if proxy was added, False if duplicate or invalid type
         """
         # Validate proxy type
-        valid_types = {"http", "https", "socks4", "socks5"}
-        if proxy_type.lower() not in valid_types:
-            logger.warning(f"Invalid proxy type '{proxy_type}'. Must be one of: {valid_types}")
+        try:
+            parsed_type = ProxyType[proxy_type.upper()]
+        except KeyError:
+            logger.warning(f"Invalid proxy type '{proxy_type}'. Must be one of: {', '.join(PROXY_TYPE_NAMES)}")
             return False
         
-        proxy_type = proxy_type.lower()
-        
         with self._lock:
             # Check for duplicates
-            for proxy in self.proxies:
-                if proxy.host == host and proxy.port == port:
-                    logger.warning(f"Proxy {host}:{port} already exists in pool")
-                    return False
+            if (host, port) in self._by_endpoint:
+                logger.warning(f"Proxy {host}:{port} already exists in pool")
+                return False
             
             proxy = ProxyEntry(
                 host=host,
                 port=port,
-                proxy_type=proxy_type,
+                proxy_type=parsed_type,
                 username=username,
                 password=password
             )
             self.proxies.append(proxy)
+            self._by_endpoint[(host, port)] = proxy
+            self._rebuild_active()
             logger.info(f"Added proxy {host}:{port} to pool")
             return True
 
+    def bulk_add(self, entries: Iterable[Tuple[str, int, ProxyType, Optional[str], Optional[str]]]) -> int:
+        """Add many proxies under a single lock acquisition
+        
+        Args:
+            entries: (host, port, proxy_type, username, password) tuples with
+                proxy_type already parsed to a ProxyType
+            
+        Returns:
+            Number of proxies added (duplicates are skipped)
+        """
+        added = 0
+        with self._lock:
+            for host, port, proxy_type, username, password in entries:
+                key = (host, port)
+                if key in self._by_endpoint:
+                    continue
+                proxy = ProxyEntry(
+                    host=host,
+                    port=port,
+                    proxy_type=proxy_type,
+                    username=username,
+                    password=password
+                )
+                self.proxies.append(proxy)
+                self._by_endpoint[key] = proxy
+                added += 1
+            if added:
+                self._rebuild_active()
+        return added
+
     def remove_proxy(self, host: str, port: int) -> bool:
         """Remove a proxy from the pool"""
         with self._lock:
-            for i, proxy in enumerate(self.proxies):
-                if proxy.host == host and proxy.port == port:
-                    self.proxies.pop(i)
-                    logger.info(f"Removed proxy {host}:{port} from pool")
-                    return True
-            return False
+            proxy = self._by_endpoint.pop((host, port), None)
+            if proxy is None:
+                return False
+            self.proxies.remove(proxy)
+            self._rebuild_active()
+            logger.info(f"Removed proxy {host}:{port} from pool")
+            return True
+
+    def _rebuild_active(self):
+        """Rebuild the active proxy snapshot (caller must hold the lock)"""
+        self._active = tuple(p for p in self.proxies if p.is_active)
+        self._generation += 1
+
+    def get_active_count(self) -> int:
+        """Get the number of active proxies"""
+        return len(self._active)
 
     def get_current_proxy(self) -> Optional[ProxyEntry]:
         """Get the current active proxy"""
-        with self._lock:
-            active_proxies = [p for p in self.proxies if p.is_active]
-            if not active_proxies:
-                return None
-            
-            self.current_proxy_index = self.current_proxy_index % len(active_proxies)
-            return active_proxies[self.current_proxy_index]
+        active_proxies = self._active
+        if not active_proxies:
+            return None
+        return active_proxies[self.current_proxy_index % len(active_proxies)]
 
     def rotate(self):
         """Rotate to the next proxy"""
         with self._lock:
-            active_proxies = [p for p in self.proxies if p.is_active]
+            active_proxies = self._active
             if len(active_proxies) <= 1:
                 return
             
@@ -252,59 +456,98 @@ class ProxyPool:
 
     def validate_proxy(self, proxy: ProxyEntry) -> bool:
         """Validate a proxy is working"""
-        start_time = time.time()
+        url = urllib.parse.urlsplit(self.validation_url)
+        scheme = url.scheme or "http"
+        port = url.port or (443 if scheme == "https" else 80)
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        if scheme == "http":
+            # Absolute URL, as for any plain HTTP request through a proxy
+            path = self.validation_url
+            auth = proxy.get_auth_header()
+            if auth:
+                headers['Proxy-Authorization'] = auth
+        else:
+            path = url.path or "/"
+            if url.query:
+                path = f"{path}?{url.query}"
+        
+        start_time = time.monotonic()
+        ok = False
+        conn = None
         try:
-            proxy_handler = urllib.request.ProxyHandler({
-                'http': proxy.get_url(),
-                'https': proxy.get_url()
-            })
-            opener = urllib.request.build_opener(proxy_handler)
-            
-            request = urllib.request.Request(
-                self.validation_url,
-                headers={'User-Agent': 'Mozilla/5.0'}
-            )
-            
-            with opener.open(request, timeout=self.validation_timeout) as response:
-                if response.getcode() == 200:
-                    response_time = time.time() - start_time
-                    proxy.record_success(response_time)
-                    proxy.last_validated = time.time()
-                    proxy.is_active = True
-                    return True
-                    
-        except Exception as e:
+            conn = open_upstream_connection(proxy, url.hostname, port, scheme,
+                                            self.validation_timeout)
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status == 200
+            if not ok:
+                logger.debug(f"Proxy validation failed for {proxy.host}:{proxy.port}: HTTP {response.status}")
+        except (http.client.HTTPException, OSError) as e:
             logger.debug(f"Proxy validation failed for {proxy.host}:{proxy.port}: {e}")
-            proxy.record_failure()
+        finally:
+            if conn:
+                conn.close()
+        
+        if ok:
+            now = time.time()
+            proxy.record_success(time.monotonic() - start_time, now)
+            proxy.last_validated = now
+            self._set_active(proxy, True)
+            return True
+        
+        proxy.record_failure()
             
-        # Disable proxy if too many failures
-        if proxy.failure_count > 5 and proxy.get_success_rate() < 0.3:
-            proxy.is_active = False
+        # Disable proxy if too many failures (success rate below 30%,
+        # compared in integers to skip the float division)
+        total = proxy.success_count + proxy.failure_count
+        if proxy.failure_count > 5 and proxy.success_count * 10 < total * 3:
+            self._set_active(proxy, False)
             logger.warning(f"Disabled proxy {proxy.host}:{proxy.port} due to high failure rate")
             
         return False
 
+    def _set_active(self, proxy: ProxyEntry, is_active: bool):
+        """Update a proxy's active flag and the active snapshot"""
+        if proxy.is_active == is_active:
+            return
+        with self._lock:
+            proxy.is_active = is_active
+            self._rebuild_active()
+
     def validate_all_proxies(self):
         """Validate all proxies in the pool"""
         logger.info("Validating all proxies...")
         # Create a copy of the list for iteration since validate_proxy may modify 
         # proxy.is_active status which affects iteration over active proxies
         proxies_snapshot = self.proxies[:]
-        for proxy in proxies_snapshot:
-            self.validate_proxy(proxy)
+        if proxies_snapshot:
+            # Validation is network-bound, so check proxies in parallel
+            workers = min(self.max_validation_workers, len(proxies_snapshot))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self.validate_proxy, proxies_snapshot))
         
-        active_count = len([p for p in self.proxies if p.is_active])
+        active_count = self.get_active_count()
         logger.info(f"Validation complete: {active_count}/{len(self.proxies)} proxies active")
 
+    def _run_event(self) -> threading.Event:
+        """Stop event for a loop being started
+        
+        Loops started together share one event so stop() ends them all. After
+        stop() a fresh event is created, so a loop from the previous run that
+        has not noticed its stop yet cannot be revived.
+        """
+        if self._stop_event.is_set():
+            self._stop_event = threading.Event()
+        return self._stop_event
+
     def start_rotation(self):
         """Start automatic rotation thread"""
-        self._running = True
+        stop_event = self._run_event()
         
         def rotation_loop():
-            while self._running:
-                time.sleep(self.rotation_interval)
-                if self._running:
-                    self.rotate()
+            while not stop_event.wait(self.rotation_interval):
+                self.rotate()
         
         self._rotation_thread = threading.Thread(target=rotation_loop, daemon=True)
         self._rotation_thread.start()
@@ -312,11 +555,11 @@ class ProxyPool:
 
     def start_validation(self):
         """Start automatic validation thread"""
+        stop_event = self._run_event()
+        
         def validation_loop():
-            while self._running:
-                time.sleep(self.validation_interval)
-                if self._running:
-                    self.validate_all_proxies()
+            while not stop_event.wait(self.validation_interval):
+                self.validate_all_proxies()
         
         self._validation_thread = threading.Thread(target=validation_loop, daemon=True)
         self._validation_thread.start()
@@ -324,17 +567,34 @@ class ProxyPool:
 
     def stop(self):
         """Stop rotation and validation threads"""
-        self._running = False
+        self._stop_event.set()
         logger.info("Stopped proxy pool threads")
 
-    def get_stats(self) -> List[dict]:
-        """Get statistics for all proxies"""
+    def get_stats(self, max_age: float = 1.0) -> List[dict]:
+        """Get statistics for all proxies
+        
+        The result is cached for up to max_age seconds and rebuilt as soon as
+        pool membership or an active flag changes; pass max_age=0 for live
+        counters.
+        """
+        generation, built_at, cached = self._stats_cache
+        if (generation == self._generation and cached is not None
+                and time.monotonic() - built_at < max_age):
+            return [dict(d) for d in cached]
+        
+        # Hold the lock only long enough to snapshot the list
         with self._lock:
-            return [p.to_dict() for p in self.proxies]
+            generation = self._generation
+            proxies = self.proxies[:]
+        stats = [p.to_dict() for p in proxies]
+        self._stats_cache = (generation, time.monotonic(), stats)
+        # Copies, so callers cannot change what later callers see
+        return [dict(d) for d in stats]
 
     def load_from_file(self, filepath: str) -> int:
         """Load proxies from a file (one per line: host:port or host:port:type)"""
         count = 0
+        entries = []
         try:
             with open(filepath, 'r') as f:
                 for line in f:
@@ -347,12 +607,18 @@ class ProxyPool:
                         host = parts[0]
                         try:
                             port = int(parts[1])
-                            proxy_type = parts[2] if len(parts) > 2 else "http"
-                            if self.add_proxy(host, port, proxy_type):
-                                count += 1
                         except ValueError:
                             logger.warning(f"Invalid port in line: {line}")
                             continue
+                        try:
+                            proxy_type = ProxyType[parts[2].upper()] if len(parts) > 2 else ProxyType.HTTP
+                        except KeyError:
+                            logger.warning(f"Invalid proxy type in line: {line}")
+                            continue
+                        entries.append((host, port, proxy_type, None, None))
+            
+            # Parse everything first, then insert under one lock
+            count = self.bulk_add(entries)
         except FileNotFoundError:
             logger.error(f"Proxy file not found: {filepath}")
         except IOError as e:
@@ -366,12 +632,103 @@ class ProxyPool:
         try:
             with open(filepath, 'w') as f:
                 for proxy in self.proxies:
-                    f.write(f"{proxy.host}:{proxy.port}:{proxy.proxy_type}\n")
+                    f.write(f"{proxy.host}:{proxy.port}:{PROXY_TYPE_NAMES[proxy.proxy_type]}\n")
             logger.info(f"Saved {len(self.proxies)} proxies to {filepath}")
         except IOError as e:
             logger.error(f"Error saving proxy file: {e}")
 
 
+class ConnectionPool:
+    """Keeps idle upstream HTTP connections for reuse (keep-alive)"""
+    
+    def __init__(self, max_per_key: int = 32, timeout: int = 30):
+        self.max_per_key = max_per_key
+        self.timeout = timeout
+        self._pools: Dict[tuple, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    @staticmethod
+    def make_key(proxy: Optional[ProxyEntry], target_host: str,
+                 target_port: int, scheme: str) -> tuple:
+        """Build the pool key for a proxy/target combination"""
+        if proxy:
+            return (proxy.host, proxy.port, target_host, target_port, scheme)
+        return (None, None, target_host, target_port, scheme)
+
+    def acquire(self, key: tuple, proxy: Optional[ProxyEntry],
+                fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection for key, or open a new one
+        
+        Idle connections the upstream has closed in the meantime are
+        dropped rather than handed out, since a request with a streamed
+        body cannot be retried once it has been sent on a dead socket.
+        
+        Returns:
+            (connection, reused) where reused is True for a pooled connection
+        """
+        if not fresh:
+            conn = None
+            stale = []
+            with self._lock:
+                idle = self._pools.get(key)
+                while idle:
+                    candidate = idle.pop()
+                    if self._is_open(candidate):
+                        conn = candidate
+                        break
+                    stale.append(candidate)
+            for candidate in stale:
+                candidate.close()
+            if conn is not None:
+                return conn, True
+        return self._create(key, proxy), False
+
+    @staticmethod
+    def _is_open(conn: http.client.HTTPConnection) -> bool:
+        """Check that an idle connection has not been closed by the upstream
+        
+        Nothing should arrive on an idle keep-alive socket, so a readable one
+        has been closed or reset (or the upstream sent stray data).
+        """
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _create(self, key: tuple, proxy: Optional[ProxyEntry]) -> http.client.HTTPConnection:
+        """Open a new connection to the target, directly or via the proxy"""
+        _, _, target_host, target_port, scheme = key
+        return open_upstream_connection(proxy, target_host, target_port, scheme,
+                                        self.timeout, self._ssl_context)
+
+    def release(self, key: tuple, conn: http.client.HTTPConnection):
+        """Return a connection to the pool, closing it if unusable or the pool is full"""
+        if conn.sock is None:
+            return
+        with self._lock:
+            idle = self._pools[key]
+            if len(idle) < self.max_per_key:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self):
+        """Close all idle connections"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for idle in pools:
+            for conn in idle:
+                conn.close()
+
+
+class ClientDisconnected(Exception):
+    """The client connection failed while its request body was being read or
+    a response was being written to it"""
+
+
 class ReverseProxyHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for the reverse proxy"""
     
@@ -381,10 +738,19 @@ class ReverseProxyHandler(http.server.BaseHTTPRequestHandler):
     target_host: str = None
     target_port: int = None
     use_ssl: bool = False
+    connection_pool: "ConnectionPool" = None
+    
+    # Set TCP_NODELAY on client connections so small responses aren't held
+    # back by Nagle's algorithm (upstream http.client sockets already do)
+    disable_nagle_algorithm = True
+    
+    # Applied to the client socket by StreamRequestHandler.setup
+    timeout = CLIENT_IDLE_TIMEOUT
     
     def log_message(self, format_msg: str, *args):
         """Override to use our logger"""
-        logger.debug("%s - %s", self.address_string(), format_msg % args)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - %s", self.address_string(), format_msg % args)
 
     def do_GET(self):
         """Handle GET requests"""
@@ -414,12 +780,109 @@ class ReverseProxyHandler(http.server.BaseHTTPRequestHandler):
         """Handle PATCH requests"""
         self.proxy_request()
 
+    def _iter_request_body(self, content_length: int):
+        """Yield the request body from the client in CHUNK_SIZE pieces
+        
+        Read errors, timeouts and a body shorter than Content-Length raise
+        ClientDisconnected, so a truncated body is never passed upstream and
+        a slow client is not mistaken for a slow upstream.
+        """
+        remaining = content_length
+        while remaining > 0:
+            try:
+                chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+            except OSError as e:
+                raise ClientDisconnected(str(e)) from e
+            if not chunk:
+                raise ClientDisconnected(
+                    f"request body ended after {content_length - remaining} "
+                    f"of {content_length} bytes"
+                )
+            remaining -= len(chunk)
+            yield chunk
+
+    def _write_client(self, data):
+        """Write to the client, turning socket errors into ClientDisconnected
+        
+        Keeps client-side failures apart from upstream ones, which raise
+        the same OSError subclasses.
+        """
+        try:
+            self.wfile.write(data)
+        except OSError as e:
+            raise ClientDisconnected(str(e)) from e
+
+    def _forward_response(self, response: http.client.HTTPResponse) -> int:
+        """Send an upstream response to the client, returning body bytes sent
+        
+        The status line, headers and whatever body the upstream has already
+        sent are assembled into one buffer, so small responses go out in a
+        single write without holding back the head of a streamed one. The
+        upstream's own Server/Date headers are forwarded as-is; send_error is
+        still used for error pages.
+        """
+        self.log_request(response.status)
+        head = bytearray(
+            f"{self.protocol_version} {response.status} {response.reason}\r\n".encode('latin-1', 'strict')
+        )
+        for key, value in response.getheaders():
+            if key.lower() not in HOP_BY_HOP:
+                head += f"{key}: {value}\r\n".encode('latin-1', 'strict')
+        head += b"\r\n"
+        
+        # read1 returns what is available instead of waiting for CHUNK_SIZE
+        first_chunk = response.read1(CHUNK_SIZE)
+        head += first_chunk
+        # From here on an error page can no longer be sent
+        self._headers_sent = True
+        self._write_client(head)
+        return len(first_chunk) + self._copy_response_body(response)
+
+    def _copy_response_body(self, response) -> int:
+        """Stream an upstream response body to the client, returning bytes sent
+        
+        Each read returns as soon as some data has arrived (up to CHUNK_SIZE),
+        so event streams and long polls are passed on as they come rather
+        than once a full chunk has accumulated.
+        """
+        total = 0
+        while True:
+            chunk = response.read1(CHUNK_SIZE)
+            if not chunk:
+                break
+            self._write_client(chunk)
+            total += len(chunk)
+        # read1 leaves a Content-Length response open after its last byte;
+        # read() marks it complete so the connection can be reused
+        response.read()
+        return total
+
+    def _upstream_failed(self, code: int, message: str,
+                         proxy: Optional[ProxyEntry], now: float):
+        """Report an upstream failure to the client and charge it to the proxy
+        
+        Once the response head has been written, a second status line would
+        corrupt the response the client is already reading, so the
+        connection is closed instead.
+        """
+        if self._headers_sent:
+            logger.warning(f"Upstream failed mid-response for {self.command} {self.path}: {message}")
+            self.close_connection = True
+        else:
+            self.send_error(code, message)
+        if proxy:
+            proxy.record_failure(now)
+
     def proxy_request(self):
         """Forward the request through the proxy"""
-        start_time = time.time()
+        self._headers_sent = False
+        # Monotonic clock for durations; wall clock read once for timestamps
+        start_time = time.monotonic()
+        now = time.time()
         bytes_in = 0
         bytes_out = 0
         success = False
+        proxy = None
 
         try:
             # Get the current proxy from the pool
@@ -431,118 +894,161 @@ class ReverseProxyHandler(http.server.BaseHTTPRequestHandler):
             
             # Read request body if present
             content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length) if content_length > 0 else None
+            body = self._iter_request_body(content_length) if content_length > 0 else None
             bytes_in = content_length
             
             # Prepare headers (exclude hop-by-hop headers)
             headers = {}
-            hop_by_hop = {'connection', 'keep-alive', 'proxy-authenticate', 
-                         'proxy-authorization', 'te', 'trailers', 'transfer-encoding', 
-                         'upgrade', 'host'}
-            
             for key, value in self.headers.items():
-                if key.lower() not in hop_by_hop:
+                if key.lower() not in HOP_BY_HOP:
                     headers[key] = value
             
             # Add host header for target
             headers['Host'] = f"{self.target_host}:{self.target_port}"
+            headers['Connection'] = 'keep-alive'
             
             # Add X-Forwarded headers
             headers['X-Forwarded-For'] = self.client_address[0]
             headers['X-Forwarded-Proto'] = scheme
             headers['X-Real-IP'] = self.client_address[0]
             
-            # Create request
-            request = urllib.request.Request(
-                target_url,
-                data=body,
-                headers=headers,
-                method=self.command
-            )
-            
-            # Set up proxy handler if we have a proxy
-            if proxy:
-                proxy_handler = urllib.request.ProxyHandler({
-                    'http': proxy.get_url(),
-                    'https': proxy.get_url()
-                })
-                opener = urllib.request.build_opener(proxy_handler)
-            else:
-                opener = urllib.request.build_opener()
+            # Plain HTTP through a proxy uses an absolute URL; direct and
+            # tunnelled (CONNECT) requests use the origin path
+            url = self.path
+            if proxy and scheme == "http":
+                url = target_url
+                auth = proxy.get_auth_header()
+                if auth:
+                    headers['Proxy-Authorization'] = auth
             
-            # Make request
+            # Make request on a pooled upstream connection
+            key = ConnectionPool.make_key(proxy, self.target_host, self.target_port, scheme)
+            conn, reused = self.connection_pool.acquire(key, proxy)
             try:
-                with opener.open(request, timeout=30) as response:
-                    response_body = response.read()
-                    bytes_out = len(response_body)
-                    
-                    # Send response status
-                    self.send_response(response.getcode())
-                    
-                    # Send response headers
-                    for key, value in response.getheaders():
-                        if key.lower() not in hop_by_hop:
-                            self.send_header(key, value)
-                    self.end_headers()
-                    
-                    # Send response body
-                    self.wfile.write(response_body)
-                    
-                    success = True
-                    
-                    # Record proxy success
-                    if proxy:
-                        proxy.record_success(time.time() - start_time)
-                        
-            except urllib.error.HTTPError as e:
-                # Forward HTTP errors
-                self.send_response(e.code)
-                for key, value in e.headers.items():
-                    if key.lower() not in hop_by_hop:
-                        self.send_header(key, value)
-                self.end_headers()
-                
-                body = e.read()
-                bytes_out = len(body)
-                self.wfile.write(body)
+                try:
+                    conn.request(self.command, url, body=body, headers=headers)
+                    response = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    # The upstream may still close a pooled connection just
+                    # as it is reused; only requests without a body can be
+                    # safely replayed
+                    if not reused or body is not None:
+                        raise
+                    conn.close()
+                    conn, reused = self.connection_pool.acquire(key, proxy, fresh=True)
+                    conn.request(self.command, url, body=body, headers=headers)
+                    response = conn.getresponse()
                 
-                # Still counts as successful proxy operation
-                success = True
-                if proxy:
-                    proxy.record_success(time.time() - start_time)
-                    
-        except urllib.error.URLError as e:
-            self.send_error(502, f"Bad Gateway: {e.reason}")
+                # Send status, headers and body
+                bytes_out = self._forward_response(response)
+            except BaseException:
+                conn.close()
+                raise
+            
+            self.connection_pool.release(key, conn)
+            success = True
+            
+            # Record proxy success
             if proxy:
-                proxy.record_failure()
+                proxy.record_success(time.monotonic() - start_time, now)
                 
+        except ClientDisconnected as e:
+            # The client broke off its own request or response; the upstream
+            # did nothing wrong, so close without charging the proxy
+            logger.debug(f"Client disconnected before response completed: {e}")
+            self.close_connection = True
+            
         except socket.timeout:
-            self.send_error(504, "Gateway Timeout")
-            if proxy:
-                proxy.record_failure()
-                
-        except BrokenPipeError:
-            # Client disconnected
-            logger.debug("Client disconnected before response completed")
+            self._upstream_failed(504, "Gateway Timeout", proxy, now)
+            
+        except (http.client.HTTPException, OSError) as e:
+            self._upstream_failed(502, f"Bad Gateway: {e}", proxy, now)
             
         except Exception as e:
-            self.send_error(500, f"Internal Server Error: {str(e)}")
             logger.exception("Error proxying request")
-            if proxy:
-                proxy.record_failure()
+            self._upstream_failed(500, f"Internal Server Error: {str(e)}", proxy, now)
         
         finally:
             # Record statistics
             if self.stats:
-                self.stats.record_request(success, bytes_in, bytes_out)
+                self.stats.record_request(success, bytes_in, bytes_out, now)
             
-            # Log request
-            elapsed = time.time() - start_time
-            proxy_info = f" via {proxy.host}:{proxy.port}" if proxy else ""
-            logger.info(
-                f"{self.command} {self.path} -> {self.target_host}{proxy_info} "
-                f"({elapsed:.3f}s, {bytes_in}B in, {bytes_out}B out)"
-            )
+            # Log request (debug only: this runs once per request)
+            if logger.isEnabledFor(logging.DEBUG):
+                elapsed = time.monotonic() - start_time
+                proxy_info = f" via {proxy.host}:{proxy.port}" if proxy else ""
+                logger.debug(
+                    f"{self.command} {self.path} -> {self.target_host}{proxy_info} "
+                    f"({elapsed:.3f}s, {bytes_in}B in, {bytes_out}B out)"
+                )
+
+
+class ReverseProxyServer(socketserver.TCPServer):
+    """TCP server that serves connections from a bounded thread pool"""
+
+    # Must be class attributes: both are read during __init__ (bind/listen)
+    allow_reuse_address = True
+    # Kernel accept backlog, distinct from how many requests we serve at once
+    request_queue_size = socket.SOMAXCONN
+
+    def __init__(self, server_address, handler_class, max_connections: int = 100,
+                 reuse_port: bool = False):
+        # Lets several worker processes bind the same port (Linux 3.9+, BSD)
+        self.reuse_port = reuse_port
+        self._client_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_connections,
+            thread_name_prefix="proxy-"
+        )
+        # Client sockets being served, shut down by server_close so their
+        # workers return instead of keeping the process alive at exit
+        self._active_requests = set()
+        self._active_lock = threading.Lock()
+        self._closing = False
+        # Pick the socket family from the listen address so IPv6 hosts work
+        host, port = server_address
+        infos = socket.getaddrinfo(host or None, port, socket.AF_UNSPEC,
+                                   socket.SOCK_STREAM, 0, socket.AI_PASSIVE)
+        self.address_family = infos[0][0]
+        super().__init__(infos[0][4], handler_class)
+
+    def server_bind(self):
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a pool worker instead of a new thread"""
+        self._client_pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        with self._active_lock:
+            if self._closing:
+                # Queued before server_close; drop it
+                self.shutdown_request(request)
+                return
+            self._active_requests.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._active_lock:
+                self._active_requests.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Queued connections are dropped; connections in progress are cut
+        # so the executor's threads can finish and be joined at exit
+        self._client_pool.shutdown(wait=False)
+        with self._active_lock:
+            self._closing = True
+            active = list(self._active_requests)
+        for request in active:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
 
 class ReverseProxy:
@@ -565,12 +1071,16 @@ class ReverseProxy:
         use_ssl: bool = False,
         rotation_interval: int = 60,
         validation_interval: int = 300,
+        max_connections: int = 100,
+        reuse_port: bool = False,
     ):
         self.listen_host = listen_host
         self.listen_port = listen_port
         self.target_host = target_host
         self.target_port = target_port
         self.use_ssl = use_ssl
+        self.max_connections = max_connections
+        self.reuse_port = reuse_port
         
         # Initialize proxy pool
         self.proxy_pool = ProxyPool(
@@ -581,8 +1091,11 @@ class ReverseProxy:
         # Initialize statistics
         self.stats = TrafficStats()
         
+        # Idle upstream connections kept for reuse
+        self.connection_pool = ConnectionPool()
+        
         # Server instance
-        self.server: Optional[socketserver.TCPServer] = None
+        self.server: Optional[ReverseProxyServer] = None
         self._running = False
         self._server_thread: Optional[threading.Thread] = None
         
@@ -591,29 +1104,54 @@ class ReverseProxy:
         self._setup_file_logging()
 
     def _setup_file_logging(self):
-        """Set up file logging"""
+        """Set up file logging
+        
+        Records are queued and written by a background listener thread so
+        request threads never block on file I/O.
+        """
         file_handler = logging.FileHandler(self.log_file)
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(
             logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         )
-        logger.addHandler(file_handler)
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._log_listener_running = False
+        self._start_log_listener()
+
+    def _start_log_listener(self):
+        if not self._log_listener_running:
+            self._log_listener.start()
+            self._log_listener_running = True
+
+    def _stop_log_listener(self):
+        """Flush queued log records to the file and stop the listener thread"""
+        if self._log_listener_running:
+            self._log_listener.stop()
+            self._log_listener_running = False
 
     def start(self):
         """Start the reverse proxy server"""
+        self._start_log_listener()
+        
         # Configure handler class variables
         ReverseProxyHandler.proxy_pool = self.proxy_pool
         ReverseProxyHandler.stats = self.stats
+        ReverseProxyHandler.connection_pool = self.connection_pool
         ReverseProxyHandler.target_host = self.target_host
         ReverseProxyHandler.target_port = self.target_port
         ReverseProxyHandler.use_ssl = self.use_ssl
         
         # Create server
-        self.server = socketserver.ThreadingTCPServer(
+        self.server = ReverseProxyServer(
             (self.listen_host, self.listen_port),
-            ReverseProxyHandler
+            ReverseProxyHandler,
+            max_connections=self.max_connections,
+            reuse_port=self.reuse_port
         )
-        self.server.allow_reuse_address = True
         
         # Start proxy pool threads
         self.proxy_pool.start_rotation()
@@ -621,7 +1159,7 @@ class ReverseProxy:
         
         # Start server in a thread
         self._running = True
-        self._server_thread = threading.Thread(target=self._serve, daemon=True)
+        self._server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
         self._server_thread.start()
         
         logger.info(
@@ -629,15 +1167,6 @@ class ReverseProxy:
             f"-> {self.target_host}:{self.target_port}"
         )
 
-    def _serve(self):
-        """Serve requests"""
-        while self._running:
-            try:
-                self.server.handle_request()
-            except Exception as e:
-                if self._running:
-                    logger.exception("Error handling request")
-
     def stop(self):
         """Stop the reverse proxy server"""
         self._running = False
@@ -645,8 +1174,12 @@ class ReverseProxy:
         
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        self.connection_pool.clear()
             
         logger.info("Reverse proxy stopped")
+        self._stop_log_listener()
 
     def get_status(self) -> dict:
         """Get current status and statistics"""
@@ -657,7 +1190,7 @@ class ReverseProxy:
             "target_address": f"{self.target_host}:{self.target_port}",
             "current_proxy": current_proxy.to_dict() if current_proxy else None,
             "proxy_count": len(self.proxy_pool.proxies),
-            "active_proxy_count": len([p for p in self.proxy_pool.proxies if p.is_active]),
+            "active_proxy_count": self.proxy_pool.get_active_count(),
             "traffic_stats": self.stats.to_dict(),
             "proxy_stats": self.proxy_pool.get_stats(),
         }
@@ -705,6 +1238,184 @@ def format_bytes(num_bytes: int) -> str:
     return f"{size:.2f} TB"
 
 
+def _h_start(proxy: ReverseProxy, args: List[str]):
+    if not proxy._running:
+        proxy.start()
+        print("✅ Reverse proxy started")
+    else:
+        print("⚠️  Proxy is already running")
+
+
+def _h_stop(proxy: ReverseProxy, args: List[str]):
+    if proxy._running:
+        proxy.stop()
+        print("✅ Reverse proxy stopped")
+    else:
+        print("⚠️  Proxy is not running")
+
+
+def _h_status(proxy: ReverseProxy, args: List[str]):
+    status = proxy.get_status()
+    print("\n📊 Status:")
+    print(f"  Running: {'Yes' if status['running'] else 'No'}")
+    print(f"  Listen: {status['listen_address']}")
+    print(f"  Target: {status['target_address']}")
+    print(f"  Proxies: {status['active_proxy_count']}/{status['proxy_count']} active")
+    
+    if status['current_proxy']:
+        cp = status['current_proxy']
+        print(f"  Current Proxy: {cp['host']}:{cp['port']}")
+        print(f"    Success Rate: {cp['success_rate']}%")
+        print(f"    Avg Response: {cp['avg_response_time']}s")
+    
+    ts = status['traffic_stats']
+    print(f"\n📈 Traffic Statistics:")
+    print(f"  Total Requests: {ts['total_requests']}")
+    print(f"  Successful: {ts['successful_requests']} ({ts['success_rate']}%)")
+    print(f"  Failed: {ts['failed_requests']}")
+    print(f"  Data In: {format_bytes(ts['bytes_received'])}")
+    print(f"  Data Out: {format_bytes(ts['bytes_sent'])}")
+    print(f"  Rate: {ts['requests_per_second']} req/s")
+    print(f"  Uptime: {ts['uptime_seconds']:.0f}s")
+
+
+def _h_add(proxy: ReverseProxy, args: List[str]):
+    if not args:
+        print("❌ Usage: add <host:port[:type]>")
+        return
+        
+    parts = args[0].split(':')
+    if len(parts) < 2:
+        print("❌ Invalid format. Use host:port[:type]")
+        return
+        
+    try:
+        host = parts[0]
+        port = int(parts[1])
+        proxy_type = parts[2] if len(parts) > 2 else "http"
+        
+        if proxy.proxy_pool.add_proxy(host, port, proxy_type):
+            print(f"✅ Added proxy {host}:{port}")
+        else:
+            print(f"⚠️  Proxy already exists")
+    except ValueError:
+        print("❌ Invalid port number")
+
+
+def _h_remove(proxy: ReverseProxy, args: List[str]):
+    if not args:
+        print("❌ Usage: remove <host:port>")
+        return
+        
+    parts = args[0].split(':')
+    if len(parts) < 2:
+        print("❌ Invalid format. Use host:port")
+        return
+        
+    try:
+        host = parts[0]
+        port = int(parts[1])
+        
+        if proxy.proxy_pool.remove_proxy(host, port):
+            print(f"✅ Removed proxy {host}:{port}")
+        else:
+            print(f"⚠️  Proxy not found")
+    except ValueError:
+        print("❌ Invalid port number")
+
+
+def _h_list(proxy: ReverseProxy, args: List[str]):
+    proxies = proxy.proxy_pool.get_stats()
+    if not proxies:
+        print("📭 No proxies in pool")
+    else:
+        # Build the whole table and emit it with a single write
+        rule = "-" * 70 + "\n"
+        out = [
+            f"\n📋 Proxy Pool ({len(proxies)} proxies):\n",
+            rule,
+            f"{'Host:Port':<25} {'Type':<8} {'Status':<10} {'Success':<10} {'Avg Time'}\n",
+            rule,
+        ]
+        out.extend(
+            f"{p['host']}:{p['port']:<15} {p['proxy_type']:<8} "
+            f"{'Active' if p['is_active'] else 'Inactive':<10} "
+            f"{p['success_rate']}%{'':<5} {p['avg_response_time']:.3f}s\n"
+            for p in proxies
+        )
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+
+def _h_rotate(proxy: ReverseProxy, args: List[str]):
+    proxy.proxy_pool.rotate()
+    current = proxy.proxy_pool.get_current_proxy()
+    if current:
+        print(f"✅ Rotated to {current.host}:{current.port}")
+    else:
+        print("⚠️  No active proxies available")
+
+
+def _h_validate(proxy: ReverseProxy, args: List[str]):
+    print("🔍 Validating proxies...")
+    proxy.proxy_pool.validate_all_proxies()
+    print("✅ Validation complete")
+
+
+def _h_load(proxy: ReverseProxy, args: List[str]):
+    if not args:
+        print("❌ Usage: load <filename>")
+        return
+        
+    count = proxy.proxy_pool.load_from_file(args[0])
+    print(f"✅ Loaded {count} proxies")
+
+
+def _h_save(proxy: ReverseProxy, args: List[str]):
+    if not args:
+        print("❌ Usage: save <filename>")
+        return
+        
+    proxy.proxy_pool.save_to_file(args[0])
+    print(f"✅ Saved proxies to {args[0]}")
+
+
+def _h_clear(proxy: ReverseProxy, args: List[str]):
+    proxy.stats = TrafficStats()
+    ReverseProxyHandler.stats = proxy.stats
+    print("✅ Statistics cleared")
+
+
+def _h_help(proxy: ReverseProxy, args: List[str]):
+    print_help()
+
+
+def _h_quit(proxy: ReverseProxy, args: List[str]) -> bool:
+    print("👋 Goodbye!")
+    proxy.stop()
+    return True
+
+
+# Interactive command handlers; a handler returning True ends the session
+HANDLERS = {
+    "start": _h_start,
+    "stop": _h_stop,
+    "status": _h_status,
+    "add": _h_add,
+    "remove": _h_remove,
+    "list": _h_list,
+    "rotate": _h_rotate,
+    "validate": _h_validate,
+    "load": _h_load,
+    "save": _h_save,
+    "clear": _h_clear,
+    "help": _h_help,
+    "quit": _h_quit,
+    "exit": _h_quit,
+    "q": _h_quit,
+}
+
+
 def interactive_mode(proxy: ReverseProxy):
     """Run in interactive mode"""
     print_banner()
@@ -733,147 +1444,13 @@ def interactive_mode(proxy: ReverseProxy):
             cmd = parts[0]
             args = parts[1:]
             
-            if cmd == "start":
-                if not proxy._running:
-                    proxy.start()
-                    print("✅ Reverse proxy started")
-                else:
-                    print("⚠️  Proxy is already running")
-                    
-            elif cmd == "stop":
-                if proxy._running:
-                    proxy.stop()
-                    print("✅ Reverse proxy stopped")
-                else:
-                    print("⚠️  Proxy is not running")
-                    
-            elif cmd == "status":
-                status = proxy.get_status()
-                print("\n📊 Status:")
-                print(f"  Running: {'Yes' if status['running'] else 'No'}")
-                print(f"  Listen: {status['listen_address']}")
-                print(f"  Target: {status['target_address']}")
-                print(f"  Proxies: {status['active_proxy_count']}/{status['proxy_count']} active")
-                
-                if status['current_proxy']:
-                    cp = status['current_proxy']
-                    print(f"  Current Proxy: {cp['host']}:{cp['port']}")
-                    print(f"    Success Rate: {cp['success_rate']}%")
-                    print(f"    Avg Response: {cp['avg_response_time']}s")
-                
-                ts = status['traffic_stats']
-                print(f"\n📈 Traffic Statistics:")
-                print(f"  Total Requests: {ts['total_requests']}")
-                print(f"  Successful: {ts['successful_requests']} ({ts['success_rate']}%)")
-                print(f"  Failed: {ts['failed_requests']}")
-                print(f"  Data In: {format_bytes(ts['bytes_received'])}")
-                print(f"  Data Out: {format_bytes(ts['bytes_sent'])}")
-                print(f"  Rate: {ts['requests_per_second']} req/s")
-                print(f"  Uptime: {ts['uptime_seconds']:.0f}s")
-                
-            elif cmd == "add":
-                if not args:
-                    print("❌ Usage: add <host:port[:type]>")
-                    continue
-                    
-                parts = args[0].split(':')
-                if len(parts) < 2:
-                    print("❌ Invalid format. Use host:port[:type]")
-                    continue
-                    
-                try:
-                    host = parts[0]
-                    port = int(parts[1])
-                    proxy_type = parts[2] if len(parts) > 2 else "http"
-                    
-                    if proxy.proxy_pool.add_proxy(host, port, proxy_type):
-                        print(f"✅ Added proxy {host}:{port}")
-                    else:
-                        print(f"⚠️  Proxy already exists")
-                except ValueError:
-                    print("❌ Invalid port number")
-                    
-            elif cmd == "remove":
-                if not args:
-                    print("❌ Usage: remove <host:port>")
-                    continue
-                    
-                parts = args[0].split(':')
-                if len(parts) < 2:
-                    print("❌ Invalid format. Use host:port")
-                    continue
-                    
-                try:
-                    host = parts[0]
-                    port = int(parts[1])
-                    
-                    if proxy.proxy_pool.remove_proxy(host, port):
-                        print(f"✅ Removed proxy {host}:{port}")
-                    else:
-                        print(f"⚠️  Proxy not found")
-                except ValueError:
-                    print("❌ Invalid port number")
-                    
-            elif cmd == "list":
-                proxies = proxy.proxy_pool.get_stats()
-                if not proxies:
-                    print("📭 No proxies in pool")
-                else:
-                    print(f"\n📋 Proxy Pool ({len(proxies)} proxies):")
-                    print("-" * 70)
-                    print(f"{'Host:Port':<25} {'Type':<8} {'Status':<10} {'Success':<10} {'Avg Time'}")
-                    print("-" * 70)
-                    
-                    for p in proxies:
-                        status = "Active" if p['is_active'] else "Inactive"
-                        print(f"{p['host']}:{p['port']:<15} {p['proxy_type']:<8} {status:<10} {p['success_rate']}%{'':<5} {p['avg_response_time']:.3f}s")
-                        
-            elif cmd == "rotate":
-                proxy.proxy_pool.rotate()
-                current = proxy.proxy_pool.get_current_proxy()
-                if current:
-                    print(f"✅ Rotated to {current.host}:{current.port}")
-                else:
-                    print("⚠️  No active proxies available")
-                    
-            elif cmd == "validate":
-                print("🔍 Validating proxies...")
-                proxy.proxy_pool.validate_all_proxies()
-                print("✅ Validation complete")
-                
-            elif cmd == "load":
-                if not args:
-                    print("❌ Usage: load <filename>")
-                    continue
-                    
-                count = proxy.proxy_pool.load_from_file(args[0])
-                print(f"✅ Loaded {count} proxies")
-                
-            elif cmd == "save":
-                if not args:
-                    print("❌ Usage: save <filename>")
-                    continue
-                    
-                proxy.proxy_pool.save_to_file(args[0])
-                print(f"✅ Saved proxies to {args[0]}")
-                
-            elif cmd == "clear":
-                proxy.stats = TrafficStats()
-                ReverseProxyHandler.stats = proxy.stats
-                print("✅ Statistics cleared")
-                
-            elif cmd == "help":
-                print_help()
-                
-            elif cmd in ["quit", "exit", "q"]:
-                print("👋 Goodbye!")
-                proxy.stop()
-                running = False
-                break
-                
-            else:
+            handler = HANDLERS.get(cmd)
+            if handler is None:
                 print(f"❌ Unknown command: {cmd}")
                 print("Type 'help' for available commands")
+            elif handler(proxy, args):
+                running = False
+                break
                 
         except EOFError:
             break
@@ -882,6 +1459,55 @@ def interactive_mode(proxy: ReverseProxy):
             continue
 
 
+def build_proxy(args: argparse.Namespace, reuse_port: bool = False) -> ReverseProxy:
+    """Create a reverse proxy from parsed command line arguments"""
+    proxy = ReverseProxy(
+        listen_host=args.listen_host,
+        listen_port=args.listen_port,
+        target_host=args.target_host,
+        target_port=args.target_port,
+        use_ssl=args.ssl,
+        rotation_interval=args.rotation_interval,
+        validation_interval=args.validation_interval,
+        max_connections=args.max_connections,
+        reuse_port=reuse_port,
+    )
+    
+    # Load proxies from file if specified
+    if args.proxy_file:
+        proxy.proxy_pool.load_from_file(args.proxy_file)
+    
+    return proxy
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    """SIGTERM handler: shut down the same way as on Ctrl+C"""
+    raise KeyboardInterrupt
+
+
+def _ignore_stop_signals():
+    """Keep a second Ctrl+C or SIGTERM from interrupting shutdown"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+def run_worker(args: argparse.Namespace):
+    """Run an additional daemon-mode worker process"""
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    parent_pid = os.getppid()
+    proxy = build_proxy(args, reuse_port=True)
+    proxy.start()
+    try:
+        # Also exit if the parent died without stopping us
+        while os.getppid() == parent_pid:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _ignore_stop_signals()
+        proxy.stop()
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -926,6 +1552,19 @@ def main():
         default=300,
         help="Proxy validation interval in seconds (default: 300)"
     )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=100,
+        help="Maximum number of connections served concurrently (default: 100)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes sharing the listen port in daemon mode "
+             "via SO_REUSEPORT (default: 1)"
+    )
     parser.add_argument(
         "--proxy-file",
         help="File to load proxies from on startup"
@@ -937,26 +1576,33 @@ def main():
     )
     
     args = parser.parse_args()
+    multi_worker = args.daemon and args.workers > 1
+    if multi_worker and not hasattr(socket, "SO_REUSEPORT"):
+        # Without it every extra worker would fail to bind the port
+        parser.error("--workers > 1 needs SO_REUSEPORT, which this platform does not have")
     
-    # Create reverse proxy instance
-    proxy = ReverseProxy(
-        listen_host=args.listen_host,
-        listen_port=args.listen_port,
-        target_host=args.target_host,
-        target_port=args.target_port,
-        use_ssl=args.ssl,
-        rotation_interval=args.rotation_interval,
-        validation_interval=args.validation_interval,
-    )
+    # Extra workers share the port and the kernel spreads incoming
+    # connections across them. They are spawned, not forked, and before
+    # this process sets up its proxy, so each builds its own logging
+    # instead of inheriting a log queue nobody drains.
+    workers = []
+    if multi_worker:
+        ctx = multiprocessing.get_context("spawn")
+        for _ in range(args.workers - 1):
+            worker = ctx.Process(target=run_worker, args=(args,), daemon=True)
+            worker.start()
+            workers.append(worker)
     
-    # Load proxies from file if specified
-    if args.proxy_file:
-        proxy.proxy_pool.load_from_file(args.proxy_file)
+    # Create reverse proxy instance
+    proxy = build_proxy(args, reuse_port=multi_worker)
     
     if args.daemon:
-        # Run in daemon mode
+        # Run in daemon mode; SIGTERM stops the workers too
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
         proxy.start()
         print(f"Reverse proxy running in daemon mode on {args.listen_host}:{args.listen_port}")
+        if workers:
+            print(f"Serving with {args.workers} worker processes (statistics are per worker)")
         print("Press Ctrl+C to stop")
         
         try:
@@ -964,7 +1610,12 @@ def main():
                 time.sleep(1)
         except KeyboardInterrupt:
             print("\nShutting down...")
+            _ignore_stop_signals()
+            for worker in workers:
+                worker.terminate()
             proxy.stop()
+            for worker in workers:
+                worker.join(timeout=5)
     else:
         # Run in interactive mode
         interactive_mode(proxy)
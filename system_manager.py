@@ -1,24 +1,220 @@
 #!/usr/bin/env python3
 import sqlite3
+import atexit
 import json
 import os
 import paramiko
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import threading
 import time
 import subprocess
+import uuid
 from pathlib import Path
 
+# Statements run on every command or connection test; the connection keeps
+# them prepared in its statement cache
+SQL_GET_SYSTEM = 'SELECT * FROM systems WHERE id = ?'
+SQL_INSERT_RESULT = '''
+    INSERT INTO command_results (system_id, command_id, output, output_path, exit_code, execution_time)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_SET_STATUS = 'UPDATE systems SET status = ?, last_seen = ? WHERE id = ?'
+SQL_SET_OFFLINE = 'UPDATE systems SET status = ? WHERE id = ?'
+SQL_COMMAND_HISTORY = '''
+    SELECT strftime('%m/%d %H:%M:%S', cr.timestamp), s.name, c.name, cr.exit_code
+    FROM command_results cr
+    LEFT JOIN systems s ON cr.system_id = s.id
+    LEFT JOIN commands c ON cr.command_id = c.id
+    ORDER BY cr.timestamp DESC
+    LIMIT 20
+'''
+
+# Most command results written to the database in one transaction
+RESULT_BATCH_SIZE = 500
+
+# Outputs longer than OUTPUT_INLINE_LIMIT characters are saved to a file in
+# OUTPUT_DIR; the database keeps the first and last OUTPUT_PREVIEW characters
+OUTPUT_INLINE_LIMIT = 16384
+OUTPUT_PREVIEW = 4096
+OUTPUT_DIR = Path("outputs")
+
+# Pooled SSH connections are closed after this many idle seconds
+SSH_IDLE_TIMEOUT = 300
+# Keepalive interval in seconds for pooled SSH connections
+SSH_KEEPALIVE = 30
+
+# Systems tested at the same time by "test all"
+TEST_WORKERS = 16
+
 class SystemManager:
     def __init__(self, db_path="systems.db"):
         self.db_path = db_path
+        # All writes go through one autocommit connection; the lock
+        # serializes use of it
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                    cached_statements=256)
+        self._lock = threading.Lock()
+        # Command results are written in batches by a background thread
+        self._result_queue = queue.Queue()
+        threading.Thread(target=self._result_writer, daemon=True).start()
+        # Connected SSH clients by system id, with the time each was last used
+        self._ssh_pool = {}
+        self._ssh_lock = threading.Lock()
+        threading.Thread(target=self._close_idle_ssh, daemon=True).start()
         self.init_database()
+        # Menu and worker reads use a separate read-only connection, so
+        # with WAL they never wait for a write in progress
+        self._read_conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                          check_same_thread=False, cached_statements=256)
+        # Rows can be read by column name as well as position
+        self._read_conn.row_factory = sqlite3.Row
+        # cache_size is per connection, so the reader needs its own
+        self._read_conn.execute('PRAGMA cache_size=-20000')
+        self._read_lock = threading.Lock()
+        # Only once everything close() touches exists
+        atexit.register(self.close)
         self.quick_commands = self.load_quick_commands()
         
     def init_database(self):
         """Initialize the SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            # WAL with synchronous=NORMAL avoids an fsync on every commit;
+            # a ~20 MB page cache (negative = KiB) and memory-mapped reads
+            # keep the history and status queries off the disk
+            self.conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-20000;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            ''')
+            # The connection autocommits, so group the schema and default
+            # commands into one explicit transaction
+            cursor = self.conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                self._create_schema(cursor)
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+
+    def close(self):
+        """Close pooled SSH connections, write pending command results and close the database"""
+        with self._ssh_lock:
+            clients = [ssh for ssh, _ in self._ssh_pool.values()]
+            self._ssh_pool.clear()
+        for ssh in clients:
+            ssh.close()
+        self._result_queue.join()
+        with self._read_lock:
+            self._read_conn.close()
+        with self._lock:
+            self.conn.close()
+
+    def _result_writer(self):
+        """Insert queued command results, everything queued so far per transaction"""
+        while True:
+            rows = [self._result_queue.get()]
+            while len(rows) < RESULT_BATCH_SIZE:
+                try:
+                    rows.append(self._result_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with self._lock:
+                    self.conn.execute('BEGIN IMMEDIATE')
+                    try:
+                        self.conn.executemany(SQL_INSERT_RESULT, rows)
+                    except Exception:
+                        self.conn.execute('ROLLBACK')
+                        raise
+                    self.conn.execute('COMMIT')
+            except Exception as e:
+                print(f"❌ Failed to save {len(rows)} command result(s): {e}")
+            finally:
+                for _ in rows:
+                    self._result_queue.task_done()
+
+    def _get_ssh(self, system, timeout, verify=False):
+        """Take the pooled SSH client for a system, connecting a new one if needed
+        
+        With verify, a pooled client is only reused after a round trip to
+        the host; is_active() alone can lag a dead host by the keepalive.
+        """
+        with self._ssh_lock:
+            entry = self._ssh_pool.pop(system['id'], None)
+        if entry:
+            ssh = entry[0]
+            transport = ssh.get_transport()
+            if transport is not None and transport.is_active():
+                if not verify:
+                    return ssh
+                try:
+                    # Opening a channel needs the server's confirmation
+                    transport.open_session(timeout=timeout).close()
+                    return ssh
+                except Exception:
+                    pass
+            ssh.close()
+        
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        if system['auth_type'] == 'key':
+            ssh.connect(system['hostname'], port=system['port'], username=system['username'], 
+                       key_filename=system['key_file'], timeout=timeout)
+        else:
+            ssh.connect(system['hostname'], port=system['port'], username=system['username'], 
+                       password=system['password'], timeout=timeout)
+        
+        ssh.get_transport().set_keepalive(SSH_KEEPALIVE)
+        return ssh
+    
+    def _put_ssh(self, system_id, ssh):
+        """Return a working SSH client to the pool"""
+        with self._ssh_lock:
+            old = self._ssh_pool.get(system_id)
+            self._ssh_pool[system_id] = (ssh, time.monotonic())
+        if old:
+            old[0].close()
+    
+    def _drop_ssh(self, system_id):
+        """Close and forget the pooled SSH client for a system"""
+        with self._ssh_lock:
+            entry = self._ssh_pool.pop(system_id, None)
+        if entry:
+            entry[0].close()
+    
+    def _close_idle_ssh(self):
+        """Close pooled SSH clients that have not been used for SSH_IDLE_TIMEOUT"""
+        while True:
+            time.sleep(SSH_IDLE_TIMEOUT / 5)
+            cutoff = time.monotonic() - SSH_IDLE_TIMEOUT
+            with self._ssh_lock:
+                idle = [sys_id for sys_id, (_, used) in self._ssh_pool.items() if used < cutoff]
+                clients = [self._ssh_pool.pop(sys_id)[0] for sys_id in idle]
+            for ssh in clients:
+                ssh.close()
+
+    @staticmethod
+    def _store_output(system_id, output):
+        """Return (output to save, file path) for a result, spilling long output to a file"""
+        if len(output) <= OUTPUT_INLINE_LIMIT:
+            return output, None
+        
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        path = OUTPUT_DIR / f"{system_id}_{uuid.uuid4().hex}.log"
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(output)
+        preview = f"{output[:OUTPUT_PREVIEW]}\n...\n{output[-OUTPUT_PREVIEW:]}"
+        return preview, str(path)
+
+    def _create_schema(self, cursor):
+        """Create tables, indexes and default commands"""
         
         # Systems table
         cursor.execute('''
@@ -59,6 +255,7 @@ class SystemManager:
                 system_id INTEGER,
                 command_id INTEGER,
                 output TEXT,
+                output_path TEXT,
                 exit_code INTEGER,
                 execution_time REAL,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -79,6 +276,17 @@ class SystemManager:
             )
         ''')
         
+        # Databases created before output_path existed
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(command_results)')]
+        if 'output_path' not in columns:
+            cursor.execute('ALTER TABLE command_results ADD COLUMN output_path TEXT')
+        
+        # Indexes for the status and recent-activity counts, command history
+        # (newest first) and per-system results
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_systems_status ON systems (status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_command_results_timestamp ON command_results (timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_command_results_system ON command_results (system_id)')
+        
         # Insert default quick commands
         default_commands = [
             ('System Info', 'uname -a && cat /etc/os-release', 'info', 'Basic system information'),
@@ -93,24 +301,26 @@ class SystemManager:
             ('Package Updates', 'apt list --upgradable 2>/dev/null || yum check-update 2>/dev/null', 'maintenance', 'Available package updates')
         ]
         
-        cursor.executemany('''
-            INSERT OR IGNORE INTO commands (name, command, category, description)
-            VALUES (?, ?, ?, ?)
-        ''', default_commands)
-        
-        conn.commit()
-        conn.close()
+        # commands has no unique key for OR IGNORE to hit, so only seed an
+        # empty table; otherwise every start would add another copy
+        if cursor.execute('SELECT 1 FROM commands LIMIT 1').fetchone() is None:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO commands (name, command, category, description)
+                VALUES (?, ?, ?, ?)
+            ''', default_commands)
         
     def load_quick_commands(self):
         """Load quick commands from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, name, command, category, description FROM commands ORDER BY category, name')
-        commands = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            commands = self._read_conn.execute(
+                'SELECT id, name, command, category, description FROM commands ORDER BY category, name'
+            ).fetchall()
         
         organized = {}
+        # Quick command id by command text, to link results to quick commands
+        self._cmd_id_by_text = {}
         for cmd_id, name, command, category, description in commands:
+            self._cmd_id_by_text.setdefault(command, cmd_id)
             if category not in organized:
                 organized[category] = []
             organized[category].append({
@@ -125,42 +335,36 @@ class SystemManager:
     def add_system(self, name, hostname, username, port=22, auth_type='password', 
                    password=None, key_file=None, os_type='linux', description='', tags=''):
         """Add a new system to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('''
-                INSERT INTO systems (name, hostname, port, username, auth_type, password, key_file, os_type, description, tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (name, hostname, port, username, auth_type, password, key_file, os_type, description, tags))
-            
-            conn.commit()
+            with self._lock:
+                self.conn.execute('''
+                    INSERT INTO systems (name, hostname, port, username, auth_type, password, key_file, os_type, description, tags)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (name, hostname, port, username, auth_type, password, key_file, os_type, description, tags))
+        
             print(f"✅ System '{name}' added successfully!")
             return True
         except sqlite3.IntegrityError:
             print(f"❌ System '{name}' already exists!")
             return False
-        finally:
-            conn.close()
     
     def list_systems(self, show_status=True):
         """List all systems with their status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if show_status:
-            cursor.execute('''
-                SELECT id, name, hostname, port, os_type, status, last_seen 
-                FROM systems ORDER BY status, name
-            ''')
-        else:
-            cursor.execute('''
-                SELECT id, name, hostname, port, os_type, status, last_seen 
-                FROM systems ORDER BY name
-            ''')
+        with self._read_lock:
+            if show_status:
+                cursor = self._read_conn.execute('''
+                    SELECT id, name, hostname, port, os_type, status,
+                           strftime('%m/%d %H:%M', last_seen)
+                    FROM systems ORDER BY status, name
+                ''')
+            else:
+                cursor = self._read_conn.execute('''
+                    SELECT id, name, hostname, port, os_type, status,
+                           strftime('%m/%d %H:%M', last_seen)
+                    FROM systems ORDER BY name
+                ''')
         
-        systems = cursor.fetchall()
-        conn.close()
+            systems = cursor.fetchall()
         
         if not systems:
             print("❌ No systems found in database.")
@@ -178,11 +382,8 @@ class SystemManager:
             # Status emojis
             status_emoji = "🟢" if status == 'online' else "🔴" if status == 'offline' else "⚫"
             
-            # Format last seen
-            if last_seen:
-                last_seen = datetime.strptime(last_seen, '%Y-%m-%d %H:%M:%S').strftime('%m/%d %H:%M')
-            else:
-                last_seen = "Never"
+            # Already formatted by the query
+            last_seen = last_seen or "Never"
             
             print(f"{sys_id:<3} {name:<15} {hostname:<20} {port:<6} {os_type:<8} {status_emoji} {status:<8} {last_seen}")
     
@@ -193,36 +394,23 @@ class SystemManager:
             print("❌ System not found!")
             return False
         
-        print(f"🔍 Testing connection to {system[1]} ({system[2]})...")
+        print(f"🔍 Testing connection to {system['name']} ({system['hostname']})...")
         
         try:
-            if system[2] == 'local':
+            if system['hostname'] == 'local':
                 # Test local system
                 result = subprocess.run(['echo', 'test'], capture_output=True, text=True)
                 success = result.returncode == 0
             else:
-                # Test SSH connection
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                
-                if system[5] == 'key':
-                    ssh.connect(system[2], port=system[3], username=system[4], 
-                               key_filename=system[7], timeout=10)
-                else:
-                    ssh.connect(system[2], port=system[3], username=system[4], 
-                               password=system[6], timeout=10)
-                
-                ssh.close()
+                # Test SSH connection; a pooled connection must answer first
+                ssh = self._get_ssh(system, timeout=10, verify=True)
+                self._put_ssh(system_id, ssh)
                 success = True
             
             # Update status in database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE systems SET status = ?, last_seen = ? WHERE id = ?
-            ''', ('online' if success else 'offline', datetime.now(), system_id))
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self.conn.execute(SQL_SET_STATUS,
+                                  ('online' if success else 'offline', datetime.now(), system_id))
             
             if success:
                 print("✅ Connection successful!")
@@ -235,24 +423,15 @@ class SystemManager:
             print(f"❌ Connection error: {e}")
             
             # Update status
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE systems SET status = ? WHERE id = ?
-            ''', ('offline', system_id))
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self.conn.execute(SQL_SET_OFFLINE, ('offline', system_id))
             
             return False
     
     def get_system(self, system_id):
         """Get system details by ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM systems WHERE id = ?', (system_id,))
-        system = cursor.fetchone()
-        conn.close()
-        return system
+        with self._read_lock:
+            return self._read_conn.execute(SQL_GET_SYSTEM, (system_id,)).fetchone()
     
     def run_command(self, system_id, command, save_result=True):
         """Run a command on a system"""
@@ -261,54 +440,37 @@ class SystemManager:
             print("❌ System not found!")
             return None
         
-        print(f"🚀 Executing command on {system[1]}...")
+        print(f"🚀 Executing command on {system['name']}...")
         print(f"💻 Command: {command}")
         print("-" * 50)
         
         try:
-            if system[2] == 'local':
+            if system['hostname'] == 'local':
                 # Run locally
                 result = subprocess.run(command, shell=True, capture_output=True, text=True)
                 output = result.stdout + result.stderr
                 exit_code = result.returncode
             else:
-                # Run via SSH
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                
-                if system[5] == 'key':
-                    ssh.connect(system[2], port=system[3], username=system[4], 
-                               key_filename=system[7], timeout=30)
-                else:
-                    ssh.connect(system[2], port=system[3], username=system[4], 
-                               password=system[6], timeout=30)
-                
-                stdin, stdout, stderr = ssh.exec_command(command, timeout=60)
-                output = stdout.read().decode() + stderr.read().decode()
-                exit_code = stdout.channel.recv_exit_status()
-                ssh.close()
+                # Run via SSH, reusing the pooled connection
+                ssh = self._get_ssh(system, timeout=30)
+                try:
+                    stdin, stdout, stderr = ssh.exec_command(command, timeout=60)
+                    output = stdout.read().decode() + stderr.read().decode()
+                    exit_code = stdout.channel.recv_exit_status()
+                except Exception:
+                    ssh.close()
+                    raise
+                self._put_ssh(system_id, ssh)
             
             print(output)
             print("-" * 50)
             print(f"📊 Exit code: {exit_code}")
             
             if save_result:
-                # Save to database
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                
-                # Get command ID if it exists in quick commands
-                cursor.execute('SELECT id FROM commands WHERE command = ?', (command,))
-                command_row = cursor.fetchone()
-                command_id = command_row[0] if command_row else None
-                
-                cursor.execute('''
-                    INSERT INTO command_results (system_id, command_id, output, exit_code, execution_time)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (system_id, command_id, output, exit_code, 0.0))
-                
-                conn.commit()
-                conn.close()
+                # Saved to the database by the result writer thread
+                command_id = self._cmd_id_by_text.get(command)
+                saved_output, output_path = self._store_output(system_id, output)
+                self._result_queue.put((system_id, command_id, saved_output, output_path, exit_code, 0.0))
             
             return output, exit_code
             
@@ -319,11 +481,10 @@ class SystemManager:
     
     def run_quick_command(self, system_id, command_id):
         """Run a predefined quick command"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT name, command FROM commands WHERE id = ?', (command_id,))
-        command_data = cursor.fetchone()
-        conn.close()
+        with self._read_lock:
+            command_data = self._read_conn.execute(
+                'SELECT name, command FROM commands WHERE id = ?', (command_id,)
+            ).fetchone()
         
         if not command_data:
             print("❌ Quick command not found!")
@@ -341,7 +502,7 @@ class SystemManager:
             print("❌ System not found!")
             return False
         
-        print(f"📸 Attempting screenshot on {system[1]}...")
+        print(f"📸 Attempting screenshot on {system['name']}...")
         
         # Different screenshot commands for different OS types
         screenshot_commands = {
@@ -350,7 +511,7 @@ class SystemManager:
             'macos': ['screencapture -x screenshot.png']
         }
         
-        os_type = system[8] or 'linux'
+        os_type = system['os_type'] or 'linux'
         commands = screenshot_commands.get(os_type, screenshot_commands['linux'])
         
         success = False
@@ -409,15 +570,12 @@ class SystemManager:
                 self.list_systems(show_status=False)
                 system_id = input("Enter system ID to test (or 'all' for all systems): ").strip()
                 if system_id.lower() == 'all':
-                    conn = sqlite3.connect(self.db_path)
-                    cursor = conn.cursor()
-                    cursor.execute('SELECT id FROM systems')
-                    systems = cursor.fetchall()
-                    conn.close()
+                    with self._read_lock:
+                        systems = self._read_conn.execute('SELECT id FROM systems').fetchall()
                     
-                    for sys_id in systems:
-                        self.test_connection(sys_id[0])
-                        time.sleep(1)  # Avoid overwhelming the network
+                    # Tests mostly wait on the network, so run them in parallel
+                    with ThreadPoolExecutor(max_workers=TEST_WORKERS) as pool:
+                        list(pool.map(self.test_connection, [sys_id[0] for sys_id in systems]))
                 else:
                     try:
                         self.test_connection(int(system_id))
@@ -504,29 +662,19 @@ class SystemManager:
             print("❌ System not found!")
             return
         
-        confirm = input(f"⚠️  Are you sure you want to delete system '{system[1]}'? (y/N): ")
+        confirm = input(f"⚠️  Are you sure you want to delete system '{system['name']}'? (y/N): ")
         if confirm.lower() == 'y':
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM systems WHERE id = ?', (system_id,))
-            conn.commit()
-            conn.close()
+            self._drop_ssh(system_id)
+            with self._lock:
+                self.conn.execute('DELETE FROM systems WHERE id = ?', (system_id,))
             print("✅ System deleted successfully!")
     
     def show_command_history(self):
         """Show command execution history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT cr.timestamp, s.name, c.name, cr.exit_code
-            FROM command_results cr
-            LEFT JOIN systems s ON cr.system_id = s.id
-            LEFT JOIN commands c ON cr.command_id = c.id
-            ORDER BY cr.timestamp DESC
-            LIMIT 20
-        ''')
-        history = cursor.fetchall()
-        conn.close()
+        # Include results still waiting to be written
+        self._result_queue.join()
+        with self._read_lock:
+            history = self._read_conn.execute(SQL_COMMAND_HISTORY).fetchall()
         
         if not history:
             print("📭 No command history found.")
@@ -539,7 +687,6 @@ class SystemManager:
         print("-" * 80)
         
         for timestamp, system_name, command_name, exit_code in history:
-            timestamp = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').strftime('%m/%d %H:%M:%S')
             system_name = system_name or 'Unknown'
             command_name = command_name or 'Custom Command'
             status = "✅ Success" if exit_code == 0 else "❌ Failed"